@@ -3,11 +3,13 @@
 """Main entry point for the Cosmos Validator Monitoring Discord Bot."""
 
 # --- Standard Library Imports ---
+import atexit
 import datetime
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # --- Third-Party Imports ---
 import discord
@@ -22,9 +24,26 @@ from settings import load_config
 # --- Initial Setup ---
 load_dotenv()
 
+# Writes records to the real handlers off the event loop thread
+_log_listener = None
+
+
+@atexit.register
+def _stop_log_listener():
+    """Flush queued log records and stop the listener thread."""
+    global _log_listener
+    if _log_listener:
+        _log_listener.stop()
+        _log_listener = None
+
 
 def setup_logging(log_level: str = "INFO", log_file: str = None):
-    """Configure logging with console output and optional rotating file handler."""
+    """Configure logging with console output and optional rotating file handler.
+
+    The handlers run on a QueueListener thread; the root logger only enqueues
+    records, so logging never blocks the event loop on console or file I/O.
+    """
+    global _log_listener
     level = getattr(logging, log_level.upper(), logging.INFO)
 
     formatter = logging.Formatter(
@@ -37,11 +56,12 @@ def setup_logging(log_level: str = "INFO", log_file: str = None):
 
     # Prevent duplicate handlers on reload
     root_logger.handlers.clear()
+    _stop_log_listener()
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # Rotating file handler
     if log_file:
@@ -49,7 +69,14 @@ def setup_logging(log_level: str = "INFO", log_file: str = None):
             log_file, maxBytes=5 * 1024 * 1024, backupCount=3, encoding='utf-8'
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+
+    if log_file:
         logging.info(f"File logging enabled: {log_file}")
 
 
@@ -63,8 +90,17 @@ class CosmosMonitorBot(commands.Bot):
     def __init__(self, settings, chains, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.settings = settings
-        self.supported_chains = chains  # Dict[str, ChainConfig]
-        self.async_client = httpx.AsyncClient(timeout=settings.api_timeout)
+        self.supported_chains = chains  # Dict[str, ChainConfig]; see setter
+        # Loops poll the same REST hosts repeatedly; keep connections alive
+        # between ticks instead of re-handshaking TLS after httpx's 5s default.
+        # HTTP/2 lets concurrent checks against one host share a connection.
+        self.async_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(settings.api_timeout, connect=min(5.0, settings.api_timeout)),
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0
+            ),
+        )
         self.start_time = datetime.datetime.now(datetime.timezone.utc)
         logging.info("CosmosMonitorBot initialized.")
 
@@ -126,8 +162,25 @@ class CosmosMonitorBot(commands.Bot):
 
     async def on_close(self):
         """Clean up resources on shutdown."""
-        logging.info("Closing bot... Closing HTTP client session.")
+        logging.info("Closing bot... Closing HTTP client session and database.")
         await self.async_client.aclose()
+        await db_manager.close_db()
+
+    async def close(self):
+        """Close the Discord connection, then release the bot's own resources."""
+        await super().close()
+        await self.on_close()
+
+    @property
+    def supported_chains(self) -> dict:
+        """Configured chains keyed by name."""
+        return self._supported_chains
+
+    @supported_chains.setter
+    def supported_chains(self, chains: dict):
+        """Replace chain configs and re-derive the chains with slashing data."""
+        self._supported_chains = chains
+        self.slashing_chains = [c for c in chains.values() if c.missed_blocks_supported]
 
     @property
     def uptime(self) -> datetime.timedelta:
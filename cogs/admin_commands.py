@@ -121,6 +121,7 @@ class AdminCommands(commands.Cog):
         app_commands.Choice(name="Min Stake Change Amount", value="min_stake_change_amount"),
         app_commands.Choice(name="API Timeout (seconds)", value="api_timeout"),
         app_commands.Choice(name="API Max Retries", value="api_max_retries"),
+        app_commands.Choice(name="Max Concurrent Checks", value="max_concurrent_checks"),
         app_commands.Choice(name="Log Level", value="log_level"),
     ])
     @is_bot_admin()
@@ -2,31 +2,94 @@
 # -*- coding: utf-8 -*-
 """General-purpose slash commands for the bot."""
 
+import asyncio
 import datetime
 import logging
+import time
 from typing import Union
 
 import discord
+import orjson
 from discord import app_commands
 from discord.ext import commands
 
 import db_manager
 from utils import chain_autocomplete
+from utils.api_helpers import ValidatorStatus
 from utils.embed_factory import create_validator_status_embed
 from utils.governance_helpers import (
-    extract_proposal_title, fetch_tally, format_tally_inline
+    ACTIVE_PROPOSAL_STATUSES, extract_proposal_title, fetch_tally, format_discord_timestamp,
+    format_tally_inline
 )
 from utils.retry import api_get_with_retry
 
 logger = logging.getLogger(__name__)
 
+# Proposal lists change on the order of blocks; reuse them across bursts of commands
+PROPOSALS_CACHE_TTL_SECONDS = 60
+
+# Fixed validator status rendered by /test_notification
+SAMPLE_STATUS_INFO = ValidatorStatus(
+    success=True,
+    moniker='TestValidator',
+    status='JAILED',
+    jailed=True,
+    missed_blocks=120,
+    total_stake='1,234,567.89 TST',
+    estimated_uptime='98.80%',
+    estimated_uptime_percentage=98.80,
+)
+
 
 class GeneralCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+        # chain_name -> (fetched_at, proposals) for /active_proposals
+        self._proposals_cache = {}
+        # chain_name -> in-flight proposals fetch, shared by concurrent cache misses
+        self._proposals_inflight = {}
+
+        # Static embeds, built on first use. The chains embed is rebuilt when
+        # /admin reload swaps in a new supported_chains dict.
+        self._help_embed = None
+        self._chains_embed = None
+        self._chains_embed_source = None
+
+    async def _get_proposals(self, chain_config) -> list:
+        """Fetch a chain's voting-period proposals, reusing results for a short TTL."""
+        cached = self._proposals_cache.get(chain_config.name)
+        if cached and time.monotonic() - cached[0] < PROPOSALS_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        chain_name = chain_config.name
+        task = self._proposals_inflight.get(chain_name)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_proposals(chain_config))
+            self._proposals_inflight[chain_name] = task
+            task.add_done_callback(lambda _: self._proposals_inflight.pop(chain_name, None))
+        # Shield so a cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_proposals(self, chain_config) -> list:
+        """Fetch a chain's governance proposals and store them in the TTL cache."""
+        response = await api_get_with_retry(
+            self.bot.async_client, chain_config.voting_proposals_url,
+            max_retries=self.bot.settings.api_max_retries,
+            backoff_base=self.bot.settings.api_retry_backoff,
+        )
+        proposals = orjson.loads(response.content).get('proposals', [])
+        self._proposals_cache[chain_config.name] = (time.monotonic(), proposals)
+        return proposals
+
     @app_commands.command(name="help", description="Shows information about the bot and its commands.")
     async def help(self, interaction: discord.Interaction):
+        if self._help_embed is None:
+            self._help_embed = self._build_help_embed()
+        await interaction.response.send_message(embed=self._help_embed, ephemeral=True)
+
+    def _build_help_embed(self) -> discord.Embed:
+        """Build the /help embed."""
         embed = discord.Embed(
             title="Cosmos Validator Monitoring Bot",
             description="This bot provides real-time monitoring and alerting for Cosmos-based network validators.",
@@ -52,23 +115,31 @@ class GeneralCommands(commands.Cog):
 - `/admin reload` — Reload config.yaml (admin only).
         """, inline=False)
         embed.set_footer(text=f"Monitored by {self.bot.user.name}")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return embed
 
     @app_commands.command(name="list_chains", description="Displays a list of all supported chains.")
     async def list_chains(self, interaction: discord.Interaction):
+        chains = self.bot.supported_chains
+        if self._chains_embed is None or self._chains_embed_source is not chains:
+            self._chains_embed = self._build_chains_embed(chains)
+            self._chains_embed_source = chains
+        await interaction.response.send_message(embed=self._chains_embed, ephemeral=True)
+
+    @staticmethod
+    def _build_chains_embed(chains: dict) -> discord.Embed:
+        """Build the /list_chains embed for the given chain configs."""
         embed = discord.Embed(
             title="Supported Networks",
             description="The following networks are currently configured.",
             color=discord.Color.green()
         )
-        for chain_name, config in self.bot.supported_chains.items():
+        for chain_name, config in chains.items():
             details = (
                 f"**Token:** {config.token_symbol}\n"
                 f"**Monitoring:** {'Enabled' if config.missed_blocks_supported else 'Disabled'}"
             )
             embed.add_field(name=chain_name.upper(), value=details, inline=True)
-
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return embed
 
     @app_commands.command(
         name="set_chain_notifications",
@@ -88,12 +159,15 @@ class GeneralCommands(commands.Cog):
         enable_upgrade: bool,
         mention: Union[discord.Role, discord.User] = None
     ):
-        await interaction.response.defer(ephemeral=True)
         chain_name = chain_name.lower()
         if chain_name not in self.bot.supported_chains:
-            await interaction.followup.send(f"❌ Error: Chain `{chain_name}` is not supported.")
+            await interaction.response.send_message(
+                f"❌ Error: Chain `{chain_name}` is not supported.", ephemeral=True
+            )
             return
 
+        await interaction.response.defer(ephemeral=True)
+
         mention_value = mention.mention if mention else "none"
         await db_manager.set_chain_notification_preference(
             interaction.channel_id, chain_name, enable_gov, enable_upgrade, mention_value
@@ -107,19 +181,8 @@ class GeneralCommands(commands.Cog):
     async def test_notification(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
 
-        test_status = {
-            'success': True,
-            'moniker': 'TestValidator',
-            'status': 'JAILED',
-            'jailed': True,
-            'missed_blocks': 120,
-            'total_stake': '1,234,567.89 TST',
-            'estimated_uptime': '98.80%',
-            'estimated_uptime_percentage': 98.80
-        }
-
-        embed = await create_validator_status_embed(
-            self.bot.user, "EXAMPLE-CHAIN", "examplevaloper1test...", test_status
+        embed = create_validator_status_embed(
+            self.bot.user, "EXAMPLE-CHAIN", "examplevaloper1test...", SAMPLE_STATUS_INFO
         )
         embed.title = "🔴 Critical Alert: Validator Jailed (Test)"
         embed.description = "This is a test notification to confirm alerts are configured correctly."
@@ -144,28 +207,22 @@ class GeneralCommands(commands.Cog):
     @app_commands.describe(chain_name="Name of the chain")
     @app_commands.autocomplete(chain_name=chain_autocomplete)
     async def active_proposals(self, interaction: discord.Interaction, chain_name: str):
-        await interaction.response.defer(ephemeral=False)
-
         chain_name = chain_name.lower()
         chain_config = self.bot.supported_chains.get(chain_name)
 
         if not chain_config:
-            await interaction.followup.send(
-                f"❌ Error: Chain `{chain_name.upper()}` is not supported."
+            await interaction.response.send_message(
+                f"❌ Error: Chain `{chain_name.upper()}` is not supported.", ephemeral=True
             )
             return
 
-        gov_api_url = f"{chain_config.rest_api_url}{chain_config.gov_proposals_endpoint}"
+        await interaction.response.defer(ephemeral=False)
 
         try:
-            response = await api_get_with_retry(
-                self.bot.async_client, gov_api_url,
-                max_retries=self.bot.settings.api_max_retries
-            )
-
+            # Nodes filter by status server-side; the check covers ones that ignore it
             proposals = [
-                p for p in response.json().get('proposals', [])
-                if p.get('status') == "PROPOSAL_STATUS_VOTING_PERIOD"
+                p for p in await self._get_proposals(chain_config)
+                if p.get('status') in ACTIVE_PROPOSAL_STATUSES
             ]
 
             if not proposals:
@@ -187,19 +244,14 @@ class GeneralCommands(commands.Cog):
 
                 # Fetch tally using shared helper
                 tally_url = chain_config.get_tally_endpoint(str(prop_id))
-                tally = await fetch_tally(self.bot.async_client, tally_url)
+                tally = await fetch_tally(
+                    self.bot.async_client, tally_url,
+                    backoff_base=self.bot.settings.api_retry_backoff,
+                )
                 tally_text = format_tally_inline(tally)
 
-                voting_end_time_str = prop.get('voting_end_time')
-                voting_ends_text = ""
-                if voting_end_time_str:
-                    try:
-                        end_dt = datetime.datetime.fromisoformat(
-                            voting_end_time_str.replace('Z', '+00:00')
-                        )
-                        voting_ends_text = f" • Ends <t:{int(end_dt.timestamp())}:R>"
-                    except ValueError:
-                        pass
+                voting_ends = format_discord_timestamp(prop.get('voting_end_time'))
+                voting_ends_text = f" • Ends {voting_ends}" if voting_ends else ""
 
                 embed.add_field(
                     name=f"#{prop_id}: {prop_title}",
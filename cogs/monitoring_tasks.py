@@ -8,34 +8,92 @@ Key design decisions:
   This prevents notification spam when an API goes down and comes back up.
 - All intervals and thresholds are read from bot.settings at runtime.
 - Governance and tally logic uses shared helpers to avoid duplication.
+- Last seen proposal statuses and upgrade plan names are persisted via
+  db_manager, so a restart neither re-announces nor forgets them. A chain
+  seen for the first time announces its proposals currently in deposit or
+  voting, rather than silently seeding its baseline.
 """
 
+import asyncio
 import datetime
+import itertools
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
 
 import discord
+import orjson
 from discord.ext import commands, tasks
 
 import db_manager
-from utils.api_helpers import create_progress_bar, get_validator_info, get_latest_block_height
+from settings import ChainConfig
+from utils.api_helpers import (
+    create_progress_bar, fetch_validator_set, get_validator_info, get_latest_block_height
+)
+from utils import slashing_cache
 from utils.governance_helpers import (
-    extract_proposal_title, fetch_tally, format_tally_block, get_mention_string
+    ACTIVE_PROPOSAL_STATUSES, FINAL_PROPOSAL_STATUSES, extract_proposal_title, fetch_tally,
+    format_discord_timestamp, format_tally_block, get_mention_string, parse_tally,
+    proposal_updates_slashing_params
 )
 from utils.retry import api_get_with_retry
 
 logger = logging.getLogger(__name__)
 
+# Discord allows roughly 5 messages per 5 seconds per channel
+CHANNEL_SEND_LIMIT = 5
+CHANNEL_SEND_WINDOW_SECONDS = 5.0
+
+# Discord's per-message limits when batching alert embeds
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+# Final proposal status -> (title template taking the proposal id, embed color)
+FINAL_RESULT_STYLES = {
+    "PROPOSAL_STATUS_PASSED": ("✅ Proposal #{} Passed", discord.Color.green()),
+    "PROPOSAL_STATUS_REJECTED": ("❌ Proposal #{} Rejected", discord.Color.red()),
+    "PROPOSAL_STATUS_FAILED": ("🗑️ Proposal #{} Failed", discord.Color.dark_red()),
+}
+
+
+@dataclass
+class ChainTickData:
+    """Per-chain data shared by every validator check in one monitoring tick."""
+    config: ChainConfig
+    signing_infos: dict
+    slashing_params: Optional[slashing_cache.SlashingParams]
+    validator_set: dict
+    checked_at: datetime.datetime
+    # Bounds concurrent REST lookups across all checks in the tick
+    api_semaphore: asyncio.Semaphore
+
 
 class MonitoringTasks(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-        # Caches for slashing data, governance proposals, and upgrade plans
-        self._slashing_info_cache = {}
-        self._slashing_params_cache = {}
+        # Caches for governance proposals ({chain: {prop_id: status}}) and
+        # upgrade plans ({chain: plan_name}); loaded from the DB before the
+        # first tick. Slashing data lives in utils.slashing_cache.
         self._governance_proposals_cache = {}
         self._upgrade_plan_cache = {}
 
+        # chain_name -> {valoper: staking validator}, refreshed in bulk each tick
+        self._validator_set_cache = {}
+        # chain_name -> monotonic time of that chain's last successful bulk fetch
+        self._validator_set_fetched_at = {}
+
+        # Validator status rows buffered during a tick, written in one batch
+        self._pending_status_updates = []
+
+        # channel_id -> (lock, monotonic times of recent sends) for pacing alerts
+        self._channel_buckets = {}
+        # channel_id -> (channel, [(mention, embed)]) queued during a tick, sent
+        # batched at its end. Shared by all loops; each flushes when its tick ends.
+        self._pending_notifications = {}
+
         # Per-chain API health tracking
         self._chain_api_error_status = {
             chain_name: {"is_error": False, "last_error": None}
@@ -46,12 +104,14 @@ class MonitoringTasks(commands.Cog):
         self.monitor_validators.start()
         self.monitor_governance.start()
         self.monitor_upgrades.start()
+        self.optimize_database.start()
 
     def cog_unload(self):
         """Stop all task loops when the cog is unloaded."""
         self.monitor_validators.cancel()
         self.monitor_governance.cancel()
         self.monitor_upgrades.cancel()
+        self.optimize_database.cancel()
 
     async def restart_task_if_interval_changed(self, setting_key: str):
         """Restart the relevant task loop when its interval setting changes."""
@@ -75,52 +135,132 @@ class MonitoringTasks(commands.Cog):
         """Main validator monitoring loop."""
         logger.info("Running validator monitoring loop...")
 
-        # 1. Refresh slashing cache for all chains
-        for chain_name, chain_config in self.bot.supported_chains.items():
-            if not chain_config.missed_blocks_supported:
+        validators_to_monitor = await db_manager.get_all_validators_to_monitor()
+
+        # 1. Refresh slashing caches for all chains and bulk-fetch validator sets
+        # for chains with registered validators; the two are independent.
+        await asyncio.gather(
+            self._refresh_slashing_caches(),
+            self._refresh_validator_sets({row[0] for row in validators_to_monitor}),
+        )
+
+        # 2. Check all registered validators, a bounded number at a time.
+        # Rows arrive ordered by chain, so per-chain data is resolved once per group.
+        checks = []
+        checked_at = datetime.datetime.now(datetime.timezone.utc)
+        api_semaphore = asyncio.Semaphore(self.bot.settings.max_concurrent_checks)
+        for chain_name, rows in itertools.groupby(validators_to_monitor, key=lambda row: row[0]):
+            chain_config = self.bot.supported_chains.get(chain_name)
+            if not chain_config:
                 continue
+            chain_data = ChainTickData(
+                config=chain_config,
+                signing_infos=slashing_cache.get_signing_infos(chain_name),
+                slashing_params=slashing_cache.get_slashing_params(chain_name),
+                validator_set=self._validator_set_cache.get(chain_name, {}),
+                checked_at=checked_at,
+                api_semaphore=api_semaphore,
+            )
+            checks.extend((val_data, chain_data) for val_data in rows)
 
-            try:
-                params_url = f"{chain_config.rest_api_url}{chain_config.slashing_params_endpoint}"
-                params_response = await api_get_with_retry(
-                    self.bot.async_client, params_url,
-                    max_retries=self.bot.settings.api_max_retries,
-                    backoff_base=self.bot.settings.api_retry_backoff,
-                )
-                self._slashing_params_cache[chain_name] = params_response.json().get('params', {})
+        results = await asyncio.gather(
+            *(self._check_and_notify_validator(val_data, chain_data) for val_data, chain_data in checks),
+            return_exceptions=True
+        )
+        for (val_data, _), result in zip(checks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error checking validator {val_data[1]}: {result}")
+
+        # 3. Send queued alerts and persist all status changes in a single transaction
+        await self._flush_notifications()
+        pending, self._pending_status_updates = self._pending_status_updates, []
+        if pending:
+            await db_manager.bulk_update_validator_status(pending)
+
+    async def _refresh_slashing_caches(self):
+        """Refresh the slashing cache for every chain with missed blocks support.
 
-                slashing_url = f"{chain_config.rest_api_url}{chain_config.signing_infos_endpoint}"
-                slashing_response = await api_get_with_retry(
-                    self.bot.async_client, slashing_url,
+        Per-chain API health is tracked from the results; errors are logged on
+        the transition into the error state only.
+        """
+        chains_to_refresh = self.bot.slashing_chains
+        results = await asyncio.gather(
+            *(
+                slashing_cache.refresh_slashing_cache(
+                    self.bot.async_client, chain_config,
                     max_retries=self.bot.settings.api_max_retries,
                     backoff_base=self.bot.settings.api_retry_backoff,
                 )
-                self._slashing_info_cache[chain_name] = {
-                    item['address']: item
-                    for item in slashing_response.json().get('info', [])
-                }
+                for chain_config in chains_to_refresh
+            ),
+            return_exceptions=True
+        )
 
+        for chain_config, result in zip(chains_to_refresh, results):
+            chain_name = chain_config.name
+            if isinstance(result, Exception):
+                # Log on the healthy -> error transition only; a chain that stays
+                # down would otherwise log the same error every tick.
+                if not self._chain_api_error_status.get(chain_name, {}).get("is_error"):
+                    logger.error(f"Failed to update slashing cache for {chain_name}: {result}")
+                else:
+                    logger.debug(f"Slashing cache for {chain_name} still failing: {result}")
+                slashing_cache.invalidate(chain_name)
+                self._chain_api_error_status[chain_name] = {
+                    "is_error": True, "last_error": str(result)
+                }
+            elif self._chain_api_error_status.get(chain_name, {}).get("is_error"):
                 # Mark API as healthy
-                if self._chain_api_error_status.get(chain_name, {}).get("is_error"):
-                    logger.info(f"Chain API for {chain_name} has recovered.")
-                    self._chain_api_error_status[chain_name] = {
-                        "is_error": False, "last_error": None
-                    }
-
-            except Exception as e:
-                logger.error(f"Failed to update slashing cache for {chain_name}: {e}")
-                self._slashing_params_cache[chain_name] = {}
-                self._slashing_info_cache[chain_name] = {}
+                logger.info(f"Chain API for {chain_name} has recovered.")
                 self._chain_api_error_status[chain_name] = {
-                    "is_error": True, "last_error": str(e)
+                    "is_error": False, "last_error": None
                 }
 
-        # 2. Check all registered validators
-        validators_to_monitor = await db_manager.get_all_validators_to_monitor()
-        for val_data in validators_to_monitor:
-            await self._check_and_notify_validator(val_data)
+    def get_cached_validator(self, chain_name, val_addr):
+        """Return a validator from the last tick's bulk validator set fetch, if present.
+
+        Returns None once the fetch is older than one monitor interval (e.g. the
+        loop is stalled or failing), so callers look the validator up directly.
+        """
+        fetched_at = self._validator_set_fetched_at.get(chain_name)
+        if fetched_at is None or time.monotonic() - fetched_at > self.bot.settings.monitor_interval_seconds:
+            return None
+        return self._validator_set_cache.get(chain_name, {}).get(val_addr)
+
+    async def _refresh_validator_sets(self, chain_names):
+        """Bulk-fetch staking validators for the given chains into the cache.
+
+        Chains whose bulk fetch fails are dropped from the cache, so their
+        validators fall back to individual lookups this tick.
+        """
+        chain_configs = [
+            chain_config for chain_name in chain_names
+            if (chain_config := self.bot.supported_chains.get(chain_name))
+        ]
+        results = await asyncio.gather(
+            *(
+                fetch_validator_set(
+                    self.bot.async_client, chain_config,
+                    max_retries=self.bot.settings.api_max_retries,
+                    backoff_base=self.bot.settings.api_retry_backoff,
+                )
+                for chain_config in chain_configs
+            ),
+            return_exceptions=True
+        )
+
+        self._validator_set_cache = {}
+        for chain_config, result in zip(chain_configs, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Bulk validator fetch failed for {chain_config.name}, "
+                    f"falling back to per-validator lookups: {result}"
+                )
+            else:
+                self._validator_set_cache[chain_config.name] = result
+                self._validator_set_fetched_at[chain_config.name] = time.monotonic()
 
-    async def _check_and_notify_validator(self, val_data):
+    async def _check_and_notify_validator(self, val_data, chain_data):
         """Check a single validator and send notifications if needed.
 
         CRITICAL FIX: When recovering from API_ERROR or initial UNKNOWN state,
@@ -128,37 +268,35 @@ class MonitoringTasks(commands.Cog):
         spam. Only JAILED alerts bypass the recovery grace period.
         """
         chain_name, val_addr, user_id, channel_id, old_moniker, old_status, old_missed, old_stake, mention_type = val_data
-
-        chain_config = self.bot.supported_chains.get(chain_name)
-        if not chain_config:
-            return
-
-        status_info = await get_validator_info(
-            self.bot.async_client, chain_config, val_addr,
-            self._slashing_info_cache.get(chain_name, {}),
-            self._slashing_params_cache.get(chain_name, {}),
-            max_retries=self.bot.settings.api_max_retries,
-            backoff_base=self.bot.settings.api_retry_backoff,
-        )
+        chain_config = chain_data.config
+
+        async with chain_data.api_semaphore:
+            status_info = await get_validator_info(
+                self.bot.async_client, chain_config, val_addr,
+                chain_data.signing_infos,
+                chain_data.slashing_params,
+                max_retries=self.bot.settings.api_max_retries,
+                backoff_base=self.bot.settings.api_retry_backoff,
+                validator_details=chain_data.validator_set.get(val_addr),
+            )
 
         # --- API FAILURE HANDLING ---
         # If API fails, mark as API_ERROR but KEEP the old missed_blocks value
         # to avoid a false diff when the API recovers.
-        if not status_info['success']:
+        if not status_info.success:
             if old_status != "API_ERROR":
-                await db_manager.update_validator_status(
-                    chain_name, val_addr, "API_ERROR",
+                self._queue_status_update(
+                    chain_data, val_addr, "API_ERROR",
                     old_missed,  # Preserve old missed_blocks!
-                    datetime.datetime.now().isoformat(),
                     old_moniker
                     # Do NOT update stake — preserve old value
                 )
             return
 
-        new_status = status_info['status']
-        new_jailed = status_info['jailed']
-        new_missed = status_info['missed_blocks']
-        new_stake_raw = status_info.get('raw_stake', 0.0)
+        new_status = status_info.status
+        new_jailed = status_info.jailed
+        new_missed = status_info.missed_blocks
+        new_stake_raw = status_info.raw_stake
 
         send_notification = False
         alert_title = ""
@@ -186,16 +324,16 @@ class MonitoringTasks(commands.Cog):
 
             # Send notification only if jailed
             if send_notification:
-                await self._send_validator_alert(
+                self._queue_validator_alert(
                     alert_title, embed_color, chain_name, val_addr,
-                    status_info, extra_description, user_id, channel_id
+                    status_info, extra_description, user_id, channel_id,
+                    timestamp=chain_data.checked_at
                 )
 
             # Update DB with fresh baseline and return
-            await db_manager.update_validator_status(
-                chain_name, val_addr, db_status_to_save,
-                new_missed, datetime.datetime.now().isoformat(),
-                status_info['moniker'], new_stake=new_stake_raw
+            self._queue_status_update(
+                chain_data, val_addr, db_status_to_save,
+                new_missed, status_info.moniker, new_stake=new_stake_raw
             )
             return
 
@@ -231,10 +369,9 @@ class MonitoringTasks(commands.Cog):
 
             # 3. Check Stake Changes (only when no other critical issues)
             elif old_stake > 0 and new_stake_raw > 0:
-                decimals = chain_config.decimals
                 token_symbol = chain_config.token_symbol
                 diff_raw = new_stake_raw - old_stake
-                diff_human = diff_raw / (10 ** decimals)
+                diff_human = diff_raw / chain_config.token_unit
                 min_change = self.bot.settings.min_stake_change_amount
 
                 if abs(diff_human) >= min_change:
@@ -244,78 +381,138 @@ class MonitoringTasks(commands.Cog):
                         embed_color = discord.Color.green()
                         extra_description = (
                             f"\n**Amount:** +{diff_human:,.2f} {token_symbol}"
-                            f"\n**Total Stake:** {status_info['total_stake']}"
+                            f"\n**Total Stake:** {status_info.total_stake}"
                         )
                     else:
                         alert_title = "💸 Undelegation / Slash Detected"
                         embed_color = discord.Color.dark_orange()
                         extra_description = (
                             f"\n**Amount:** {diff_human:,.2f} {token_symbol}"
-                            f"\n**Total Stake:** {status_info['total_stake']}"
+                            f"\n**Total Stake:** {status_info.total_stake}"
                         )
 
         # Send notification if needed
         if send_notification:
-            await self._send_validator_alert(
+            self._queue_validator_alert(
                 alert_title, embed_color, chain_name, val_addr,
-                status_info, extra_description, user_id, channel_id, mention_type
+                status_info, extra_description, user_id, channel_id, mention_type,
+                timestamp=chain_data.checked_at
             )
 
-        # Always update DB with latest data
-        await db_manager.update_validator_status(
-            chain_name, val_addr, db_status_to_save,
-            new_missed, datetime.datetime.now().isoformat(),
-            status_info['moniker'], new_stake=new_stake_raw
+        # Nothing to persist in the steady state; last_check_time then marks
+        # the last change rather than the last poll.
+        if (db_status_to_save, new_missed, status_info.moniker, new_stake_raw) == (
+            old_status, old_missed, old_moniker, old_stake
+        ):
+            return
+
+        self._queue_status_update(
+            chain_data, val_addr, db_status_to_save,
+            new_missed, status_info.moniker, new_stake=new_stake_raw
         )
 
-    async def _send_validator_alert(
+    def _queue_status_update(
+        self, chain_data, val_addr, status, missed_blocks, moniker, new_stake=None
+    ):
+        """Buffer a validator status row; flushed in one batch at the end of the tick."""
+        self._pending_status_updates.append((
+            status, missed_blocks, moniker, new_stake, chain_data.config.name, val_addr
+        ))
+
+    async def _send_to_channel(self, channel, **kwargs):
+        """Send a message, pacing bursts to stay under the per-channel rate limit.
+
+        A chain halt can jail many validators in one tick; without pacing the
+        burst of sends to one channel runs into repeated 429s.
+        """
+        lock, recent = self._channel_buckets.setdefault(channel.id, (asyncio.Lock(), deque()))
+        async with lock:
+            now = time.monotonic()
+            while recent and now - recent[0] >= CHANNEL_SEND_WINDOW_SECONDS:
+                recent.popleft()
+            if len(recent) >= CHANNEL_SEND_LIMIT:
+                await asyncio.sleep(CHANNEL_SEND_WINDOW_SECONDS - (now - recent.popleft()))
+            recent.append(time.monotonic())
+        await channel.send(**kwargs)
+
+    def _queue_notification(self, channel, mention, embed):
+        """Queue an embed for a channel, to be sent when the current tick ends."""
+        self._pending_notifications.setdefault(channel.id, (channel, []))[1].append((mention, embed))
+
+    async def _flush_notifications(self):
+        """Send queued notifications, packing each channel's embeds into few messages."""
+        pending, self._pending_notifications = self._pending_notifications, {}
+        await asyncio.gather(*(
+            self._send_batched(channel, items) for channel, items in pending.values()
+        ))
+
+    async def _send_batched(self, channel, items):
+        """Send (mention, embed) pairs to one channel within Discord's per-message limits."""
+        batch, batch_chars = [], 0
+        for mention, embed in items:
+            embed_chars = len(embed)
+            if batch and (
+                len(batch) >= MAX_EMBEDS_PER_MESSAGE
+                or batch_chars + embed_chars > MAX_EMBED_CHARS_PER_MESSAGE
+            ):
+                await self._send_batch(channel, batch)
+                batch, batch_chars = [], 0
+            batch.append((mention, embed))
+            batch_chars += embed_chars
+        if batch:
+            await self._send_batch(channel, batch)
+
+    async def _send_batch(self, channel, batch):
+        """Send one message carrying a batch of embeds and their distinct mentions."""
+        mentions = ' '.join(dict.fromkeys(mention for mention, _ in batch if mention))
+        try:
+            await self._send_to_channel(
+                channel, content=mentions or None, embeds=[embed for _, embed in batch]
+            )
+        except Exception as e:
+            logger.error(f"Failed to send {len(batch)} notification(s) to channel {channel.id}: {e}")
+
+    def _queue_validator_alert(
         self, title, color, chain_name, val_addr,
-        status_info, extra_description, user_id, channel_id, mention_type=None
+        status_info, extra_description, user_id, channel_id, mention_type=None,
+        timestamp=None
     ):
-        """Send a validator alert notification to the appropriate channel."""
+        """Queue a validator alert notification for the appropriate channel."""
         channel = self.bot.get_channel(channel_id)
         if not channel:
             return
 
-        embed = self._create_alert_embed(title, color, chain_name, val_addr, status_info)
+        embed = self._create_alert_embed(
+            title, color, chain_name, val_addr, status_info, timestamp
+        )
         if extra_description:
             embed.description += extra_description
 
-        try:
-            if mention_type:
-                mention_str = mention_type
-            else:
-                user = await self.bot.fetch_user(user_id)
-                mention_str = user.mention
-                
-            await channel.send(content=mention_str, embed=embed)
-        except Exception as e:
-            logger.error(f"Failed to send notification for {val_addr}: {e}")
+        # A raw <@id> mention renders the same as User.mention without a REST lookup
+        self._queue_notification(channel, mention_type or f"<@{user_id}>", embed)
 
-    def _create_alert_embed(self, title, color, chain_name, val_addr, status_info):
+    def _create_alert_embed(self, title, color, chain_name, val_addr, status_info, timestamp=None):
         """Create a standardized alert embed for validator notifications."""
         embed = discord.Embed(
             title=title,
-            description=f"An alert has been triggered for validator `{status_info['moniker']}`.",
+            description=f"An alert has been triggered for validator `{status_info.moniker}`.",
             color=color,
-            timestamp=datetime.datetime.now(datetime.timezone.utc)
+            timestamp=timestamp or datetime.datetime.now(datetime.timezone.utc)
         )
         embed.add_field(name="Chain", value=chain_name.upper(), inline=True)
         embed.add_field(name="Address", value=f"`{val_addr}`", inline=False)
-        embed.add_field(name="Status", value=status_info['status'], inline=True)
+        embed.add_field(name="Status", value=status_info.status, inline=True)
         embed.add_field(
             name="Jailed",
-            value="Yes" if status_info['jailed'] else "No",
+            value="Yes" if status_info.jailed else "No",
             inline=True
         )
-        embed.add_field(name="Missed Blocks", value=status_info['missed_blocks'], inline=True)
+        embed.add_field(name="Missed Blocks", value=status_info.missed_blocks, inline=True)
 
-        uptime_bar = create_progress_bar(
-            status_info.get('estimated_uptime_percentage', 0.0)
-        )
+        uptime_bar = create_progress_bar(status_info.estimated_uptime_percentage)
         embed.add_field(
             name="Estimated Uptime",
-            value=f"`{uptime_bar}` {status_info.get('estimated_uptime', 'N/A')}",
+            value=f"`{uptime_bar}` {status_info.estimated_uptime}",
             inline=False
         )
         embed.set_footer(text=f"Monitored by {self.bot.user.name}")
@@ -331,64 +528,98 @@ class MonitoringTasks(commands.Cog):
         logger.info("Running governance monitoring loop...")
         chains_to_monitor = await db_manager.get_all_chain_notification_chains()
 
-        for chain_name in chains_to_monitor:
-            chain_config = self.bot.supported_chains.get(chain_name)
-            if not chain_config:
-                continue
-
-            gov_api_url = f"{chain_config.rest_api_url}{chain_config.gov_proposals_endpoint}"
+        # One as-of timestamp for every notification sent this tick
+        checked_at = datetime.datetime.now(datetime.timezone.utc)
+        results = await asyncio.gather(*(
+            self._poll_governance(chain_name, checked_at) for chain_name in chains_to_monitor
+        ))
+        await self._flush_notifications()
+
+        # Persist every chain's status changes in a single transaction
+        changed, removed = [], []
+        for result in filter(None, results):
+            changed.extend(result[0])
+            removed.extend(result[1])
+        if changed or removed:
             try:
-                response = await api_get_with_retry(
-                    self.bot.async_client, gov_api_url,
-                    max_retries=self.bot.settings.api_max_retries,
-                )
-                data = response.json()
+                await db_manager.save_governance_proposal_cache(changed, removed)
+            except Exception as e:
+                logger.error(f"Failed to persist governance proposal statuses: {e}")
 
-                old_proposals = self._governance_proposals_cache.get(chain_name, {})
-                current_proposals = {
-                    p.get('id') or p.get('proposal_id'): p
-                    for p in data.get('proposals', [])
-                }
+    async def _poll_governance(self, chain_name, checked_at):
+        """Check one chain's proposals for new or changed statuses and notify.
 
-                # First run: populate cache without sending notifications
-                if not self._governance_proposals_cache.get(chain_name):
-                    self._governance_proposals_cache[chain_name] = current_proposals
-                    continue
-
-                for prop_id, prop_data in current_proposals.items():
-                    old_prop = old_proposals.get(prop_id)
-                    new_status = prop_data.get('status')
-
-                    if not old_prop:
-                        if new_status == "PROPOSAL_STATUS_VOTING_PERIOD":
-                            await self._send_governance_notification(
-                                chain_name, chain_config, prop_data, "new_voting_period"
-                            )
-                        elif new_status == "PROPOSAL_STATUS_DEPOSIT_PERIOD":
-                            await self._send_governance_notification(
-                                chain_name, chain_config, prop_data, "new_deposit_period"
-                            )
-                    elif new_status != old_prop.get('status'):
-                        if new_status == "PROPOSAL_STATUS_VOTING_PERIOD":
-                            await self._send_governance_notification(
-                                chain_name, chain_config, prop_data, "new_voting_period"
-                            )
-                        elif new_status in (
-                            "PROPOSAL_STATUS_PASSED",
-                            "PROPOSAL_STATUS_REJECTED",
-                            "PROPOSAL_STATUS_FAILED",
-                        ):
-                            await self._send_governance_notification(
-                                chain_name, chain_config, prop_data, "final_result"
-                            )
+        Returns the (changed, removed) status rows to persist, or None.
+        """
+        chain_config = self.bot.supported_chains.get(chain_name)
+        if not chain_config:
+            return
+
+        try:
+            response = await api_get_with_retry(
+                self.bot.async_client, chain_config.gov_proposals_url,
+                max_retries=self.bot.settings.api_max_retries,
+                backoff_base=self.bot.settings.api_retry_backoff,
+            )
+            data = orjson.loads(response.content)
 
-                self._governance_proposals_cache[chain_name] = current_proposals
+            old_proposals = self._governance_proposals_cache.get(chain_name, {})
+            current_proposals = {
+                str(p.get('id') or p.get('proposal_id')): p
+                for p in data.get('proposals', [])
+            }
+            current_statuses = {
+                prop_id: p.get('status', 'UNKNOWN')
+                for prop_id, p in current_proposals.items()
+            }
 
-            except Exception as e:
-                logger.error(f"Error processing governance for {chain_name}: {e}")
+            for prop_id, prop_data in current_proposals.items():
+                old_status = old_proposals.get(prop_id)
+                new_status = prop_data.get('status')
+
+                if not old_status:
+                    if new_status in ACTIVE_PROPOSAL_STATUSES:
+                        await self._send_governance_notification(
+                            chain_name, chain_config, prop_data, "new_voting_period", checked_at
+                        )
+                    elif new_status == "PROPOSAL_STATUS_DEPOSIT_PERIOD":
+                        await self._send_governance_notification(
+                            chain_name, chain_config, prop_data, "new_deposit_period", checked_at
+                        )
+                elif new_status != old_status:
+                    if new_status in ACTIVE_PROPOSAL_STATUSES:
+                        await self._send_governance_notification(
+                            chain_name, chain_config, prop_data, "new_voting_period", checked_at
+                        )
+                    elif new_status in FINAL_PROPOSAL_STATUSES:
+                        await self._send_governance_notification(
+                            chain_name, chain_config, prop_data, "final_result", checked_at
+                        )
+                        if (
+                            new_status == "PROPOSAL_STATUS_PASSED"
+                            and proposal_updates_slashing_params(prop_data)
+                        ):
+                            slashing_cache.mark_params_stale(chain_name)
+
+            if current_statuses != old_proposals:
+                self._governance_proposals_cache[chain_name] = current_statuses
+                return (
+                    [
+                        (chain_name, prop_id, status)
+                        for prop_id, status in current_statuses.items()
+                        if old_proposals.get(prop_id) != status
+                    ],
+                    [(chain_name, prop_id) for prop_id in old_proposals.keys() - current_statuses.keys()],
+                )
+
+        except Exception as e:
+            logger.error(f"Error processing governance for {chain_name}: {e}")
+        return None
 
-    async def _send_governance_notification(self, chain_name, chain_config, prop_data, notif_type):
-        """Build and send a governance notification embed."""
+    async def _send_governance_notification(
+        self, chain_name, chain_config, prop_data, notif_type, timestamp
+    ):
+        """Build a governance notification embed and queue it for subscribed channels."""
         prop_id = prop_data.get('id') or prop_data.get('proposal_id', 'N/A')
         prop_title = extract_proposal_title(prop_data)
         prop_desc = (
@@ -406,49 +637,34 @@ class MonitoringTasks(commands.Cog):
         if notif_type == "new_deposit_period":
             title = f"🆕 Proposal #{prop_id} in Deposit Period"
             color = discord.Color.blue()
-            end_time_str = prop_data.get('deposit_end_time')
-            if end_time_str:
-                try:
-                    end_dt = datetime.datetime.fromisoformat(
-                        end_time_str.replace('Z', '+00:00')
-                    )
-                    suffix = f"\n\n**Deposit Ends:** <t:{int(end_dt.timestamp())}:R>"
-                except ValueError:
-                    pass
+            if deposit_ends := format_discord_timestamp(prop_data.get('deposit_end_time')):
+                suffix = f"\n\n**Deposit Ends:** {deposit_ends}"
 
         elif notif_type == "new_voting_period":
             title = f"🗳️ Proposal #{prop_id} Enters Voting"
             color = discord.Color.orange()
-            end_time_str = prop_data.get('voting_end_time')
-            if end_time_str:
-                try:
-                    end_dt = datetime.datetime.fromisoformat(
-                        end_time_str.replace('Z', '+00:00')
-                    )
-                    suffix = f"\n\n**Voting Ends:** <t:{int(end_dt.timestamp())}:R>"
-                except ValueError:
-                    pass
+            if voting_ends := format_discord_timestamp(prop_data.get('voting_end_time')):
+                suffix = f"\n\n**Voting Ends:** {voting_ends}"
 
         elif notif_type == "final_result":
-            status_map = {
-                "PROPOSAL_STATUS_PASSED": (
-                    f"✅ Proposal #{prop_id} Passed", discord.Color.green()
-                ),
-                "PROPOSAL_STATUS_REJECTED": (
-                    f"❌ Proposal #{prop_id} Rejected", discord.Color.red()
-                ),
-                "PROPOSAL_STATUS_FAILED": (
-                    f"🗑️ Proposal #{prop_id} Failed", discord.Color.dark_red()
-                ),
-            }
-            title, color = status_map.get(
-                prop_status_raw,
-                (f"ℹ️ Proposal #{prop_id} Concluded", discord.Color.light_grey())
+            title_template, color = FINAL_RESULT_STYLES.get(
+                prop_status_raw, ("ℹ️ Proposal #{} Concluded", discord.Color.light_grey())
             )
+            title = title_template.format(prop_id)
 
-            # Fetch final tally results
-            tally_url = chain_config.get_tally_endpoint(str(prop_id))
-            tally = await fetch_tally(self.bot.async_client, tally_url)
+            # Finished proposals carry their final tally; only fetch it when missing
+            tally = {}
+            if final_tally := prop_data.get('final_tally_result'):
+                try:
+                    tally = parse_tally(final_tally)
+                except (TypeError, ValueError):
+                    tally = {}
+            if not tally.get('total'):
+                tally_url = chain_config.get_tally_endpoint(str(prop_id))
+                tally = await fetch_tally(
+                    self.bot.async_client, tally_url,
+                    backoff_base=self.bot.settings.api_retry_backoff,
+                )
             tally_text = format_tally_block(tally)
             suffix = f"\n\n**Final Tally:**\n{tally_text}"
 
@@ -456,7 +672,7 @@ class MonitoringTasks(commands.Cog):
             title=title,
             description=f"**{prop_title}**\n\n{prop_desc}{suffix}",
             color=color,
-            timestamp=datetime.datetime.now(datetime.timezone.utc)
+            timestamp=timestamp
         )
         embed.add_field(name="Chain", value=chain_name.upper())
         embed.add_field(name="Status", value=prop_status_clean)
@@ -467,13 +683,9 @@ class MonitoringTasks(commands.Cog):
             if config['notify_gov_enabled']:
                 channel = self.bot.get_channel(config['channel_id'])
                 if channel:
-                    mention_str = get_mention_string(config.get('mention_type'))
-                    try:
-                        await channel.send(content=mention_str, embed=embed)
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to send gov notification to {channel.id}: {e}"
-                        )
+                    self._queue_notification(
+                        channel, get_mention_string(config['mention_type']), embed
+                    )
 
     # =========================================================================
     # Upgrade Monitoring
@@ -485,31 +697,60 @@ class MonitoringTasks(commands.Cog):
         logger.info("Running upgrade monitoring loop...")
         chains_to_monitor = await db_manager.get_all_chain_notification_chains()
 
-        for chain_name in chains_to_monitor:
-            chain_config = self.bot.supported_chains.get(chain_name)
-            if not chain_config:
-                continue
+        checked_at = datetime.datetime.now(datetime.timezone.utc)
+        results = await asyncio.gather(*(
+            self._poll_upgrade(chain_name, checked_at) for chain_name in chains_to_monitor
+        ))
+        await self._flush_notifications()
 
-            upgrade_url = f"{chain_config.rest_api_url}{chain_config.current_plan_endpoint}"
+        # Persist every chain's plan change in a single transaction
+        if plans := dict(filter(None, results)):
             try:
-                response = await api_get_with_retry(
-                    self.bot.async_client, upgrade_url,
+                await db_manager.save_upgrade_plans(plans)
+            except Exception as e:
+                logger.error(f"Failed to persist upgrade plans: {e}")
+
+    async def _poll_upgrade(self, chain_name, checked_at):
+        """Check one chain's current upgrade plan and notify on a new plan.
+
+        Returns (chain_name, plan_name) when the stored plan needs updating, else None.
+        """
+        chain_config = self.bot.supported_chains.get(chain_name)
+        if not chain_config:
+            return
+
+        try:
+            # The height is only used by a new-plan notice, but fetching it
+            # alongside the plan keeps that notice to a single round trip.
+            response, current_height = await asyncio.gather(
+                api_get_with_retry(
+                    self.bot.async_client, chain_config.current_plan_url,
                     max_retries=self.bot.settings.api_max_retries,
-                )
-                current_plan = response.json().get('plan') if response.status_code == 200 else None
-                old_plan = self._upgrade_plan_cache.get(chain_name)
+                    backoff_base=self.bot.settings.api_retry_backoff,
+                ),
+                get_latest_block_height(
+                    self.bot.async_client, chain_config.rest_api_url,
+                    backoff_base=self.bot.settings.api_retry_backoff,
+                ),
+            )
+            current_plan = orjson.loads(response.content).get('plan') if response.status_code == 200 else None
+            current_plan_name = current_plan['name'] if current_plan else None
+            old_plan_name = self._upgrade_plan_cache.get(chain_name)
 
-                if current_plan and (
-                    not old_plan or current_plan['name'] != old_plan['name']
-                ):
-                    await self._send_upgrade_notification(chain_name, chain_config, current_plan)
+            if current_plan and current_plan_name != old_plan_name:
+                await self._send_upgrade_notification(
+                    chain_name, current_plan, current_height, checked_at
+                )
 
-                self._upgrade_plan_cache[chain_name] = current_plan
-            except Exception as e:
-                logger.error(f"Error processing upgrades for {chain_name}: {e}")
+            if current_plan_name != old_plan_name or chain_name not in self._upgrade_plan_cache:
+                self._upgrade_plan_cache[chain_name] = current_plan_name
+                return chain_name, current_plan_name
+        except Exception as e:
+            logger.error(f"Error processing upgrades for {chain_name}: {e}")
+        return None
 
-    async def _send_upgrade_notification(self, chain_name, chain_config, plan_data):
-        """Build and send an upgrade notification embed."""
+    async def _send_upgrade_notification(self, chain_name, plan_data, current_height, timestamp):
+        """Build an upgrade notification embed and queue it for subscribed channels."""
         plan_name = plan_data.get('name', 'N/A')
         plan_height = int(plan_data.get('height', 0))
         plan_time_str = plan_data.get('time')
@@ -522,13 +763,10 @@ class MonitoringTasks(commands.Cog):
                 f"**{chain_name.upper()}** network."
             ),
             color=discord.Color.purple(),
-            timestamp=datetime.datetime.now(datetime.timezone.utc)
+            timestamp=timestamp
         )
 
         if plan_height > 0:
-            current_height = await get_latest_block_height(
-                self.bot.async_client, chain_config.rest_api_url
-            )
             blocks_remaining = (
                 f"{plan_height - current_height:,}"
                 if current_height and plan_height > current_height
@@ -542,16 +780,13 @@ class MonitoringTasks(commands.Cog):
             )
 
         if plan_time_str:
-            try:
-                plan_dt = datetime.datetime.fromisoformat(
-                    plan_time_str.replace('Z', '+00:00')
-                )
+            if plan_time := format_discord_timestamp(plan_time_str, 'F'):
                 embed.add_field(
                     name="Target Time (UTC)",
-                    value=f"<t:{int(plan_dt.timestamp())}:F>",
+                    value=plan_time,
                     inline=False
                 )
-            except ValueError:
+            else:
                 embed.add_field(
                     name="Target Time", value=f"`{plan_time_str}`", inline=False
                 )
@@ -569,13 +804,21 @@ class MonitoringTasks(commands.Cog):
             if config['notify_upgrade_enabled']:
                 channel = self.bot.get_channel(config['channel_id'])
                 if channel:
-                    mention_str = get_mention_string(config.get('mention_type'))
-                    try:
-                        await channel.send(content=mention_str, embed=embed)
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to send upgrade notification to {channel.id}: {e}"
-                        )
+                    self._queue_notification(
+                        channel, get_mention_string(config['mention_type']), embed
+                    )
+
+    # =========================================================================
+    # Database Maintenance
+    # =========================================================================
+
+    @tasks.loop(hours=1)
+    async def optimize_database(self):
+        """Keep the query planner's statistics current as the tables grow."""
+        try:
+            await db_manager.optimize_db()
+        except Exception as e:
+            logger.warning(f"Database optimize failed: {e}")
 
     # =========================================================================
     # Before-Loop Hooks
@@ -592,6 +835,7 @@ class MonitoringTasks(commands.Cog):
     @monitor_governance.before_loop
     async def before_monitor_governance(self):
         await self.bot.wait_until_ready()
+        self._governance_proposals_cache = await db_manager.get_governance_proposal_cache()
         self.monitor_governance.change_interval(
             seconds=self.bot.settings.governance_check_interval_seconds
         )
@@ -599,10 +843,15 @@ class MonitoringTasks(commands.Cog):
     @monitor_upgrades.before_loop
     async def before_monitor_upgrades(self):
         await self.bot.wait_until_ready()
+        self._upgrade_plan_cache = await db_manager.get_upgrade_plan_cache()
         self.monitor_upgrades.change_interval(
             seconds=self.bot.settings.upgrade_check_interval_seconds
         )
 
+    @optimize_database.before_loop
+    async def before_optimize_database(self):
+        await self.bot.wait_until_ready()
+
 
 async def setup(bot: commands.Bot):
     """Required function to load the Cog."""
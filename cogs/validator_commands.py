@@ -2,14 +2,17 @@
 # -*- coding: utf-8 -*-
 """Slash commands for managing and querying individual validators."""
 
+import asyncio
+import datetime
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 from typing import Union
 
 import db_manager
-from utils import chain_autocomplete
-from utils.api_helpers import get_validator_info
+from utils import chain_autocomplete, slashing_cache
+from utils.api_helpers import ValidatorStatus, get_validator_info
 from utils.embed_factory import create_validator_status_embed
 
 
@@ -29,33 +32,38 @@ class ValidatorCommands(commands.Cog):
         chain_name: str, validator_address: str,
         mention: Union[discord.Role, discord.User] = None
     ):
-        await interaction.response.defer(ephemeral=True)
         chain_name = chain_name.lower()
         chain_config = self.bot.supported_chains.get(chain_name)
 
+        # Cheap validation first, so invalid input costs no defer round-trip
         if not chain_config:
-            await interaction.followup.send(f"Error: Chain `{chain_name}` is not supported.")
+            await interaction.response.send_message(
+                f"Error: Chain `{chain_name}` is not supported.", ephemeral=True
+            )
             return
 
         if not validator_address.startswith(chain_config.valoper_prefix):
-            await interaction.followup.send(
+            await interaction.response.send_message(
                 f"Error: Invalid address format for `{chain_name.upper()}`. "
-                f"Expected prefix: `{chain_config.valoper_prefix}`"
+                f"Expected prefix: `{chain_config.valoper_prefix}`",
+                ephemeral=True
             )
             return
 
+        await interaction.response.defer(ephemeral=True)
+
         status_info = await get_validator_info(
-            self.bot.async_client, chain_config, validator_address, {}, {},
+            self.bot.async_client, chain_config, validator_address, {}, None,
             max_retries=self.bot.settings.api_max_retries,
             backoff_base=self.bot.settings.api_retry_backoff,
         )
-        if not status_info.get('success'):
+        if not status_info.success:
             await interaction.followup.send(
                 f"Error: Could not find validator `{validator_address}` on `{chain_name.upper()}`."
             )
             return
 
-        moniker = status_info['moniker']
+        moniker = status_info.moniker
         mention_val = mention.mention if mention else None
         if await db_manager.add_validator(
             interaction.user.id, interaction.channel.id, chain_name, validator_address, moniker, mention_val
@@ -102,34 +110,51 @@ class ValidatorCommands(commands.Cog):
             await interaction.followup.send("You are not currently monitoring any validators.")
             return
 
-        # Access monitoring cog for cache data
-        monitoring_cog = self.bot.get_cog('MonitoringTasks')
-        if not monitoring_cog:
-            await interaction.followup.send(
-                "Error: Monitoring service is not available. Cannot fetch uptime data."
-            )
-            return
-
-        embeds = []
-        for chain, val_addr, _, _, _ in validators:
-            chain_config = self.bot.supported_chains.get(chain)
-            if not chain_config:
-                continue
-
-            slashing_info = monitoring_cog._slashing_info_cache.get(chain, {})
-            slashing_params = monitoring_cog._slashing_params_cache.get(chain, {})
-
-            status_info = await get_validator_info(
-                self.bot.async_client,
-                chain_config,
-                val_addr,
-                slashing_info,
-                slashing_params,
+        targets = [
+            (chain, val_addr, chain_config)
+            for chain, val_addr, _, _, _ in validators
+            if (chain_config := self.bot.supported_chains.get(chain))
+        ]
+
+        # Prime slashing caches once per unique chain, then fan out status fetches
+        unique_chains = {chain_config.name: chain_config for _, _, chain_config in targets}
+        await asyncio.gather(*(
+            slashing_cache.ensure_slashing_cache(
+                self.bot.async_client, chain_config,
                 max_retries=self.bot.settings.api_max_retries,
                 backoff_base=self.bot.settings.api_retry_backoff,
             )
+            for chain_config in unique_chains.values()
+        ))
+
+        # Registered validators were bulk-fetched by the last monitoring tick;
+        # reuse those entries and only look up the ones it doesn't have.
+        monitor = self.bot.get_cog('MonitoringTasks')
+        results = await asyncio.gather(
+            *(
+                get_validator_info(
+                    self.bot.async_client,
+                    chain_config,
+                    val_addr,
+                    slashing_cache.get_signing_infos(chain),
+                    slashing_cache.get_slashing_params(chain),
+                    max_retries=self.bot.settings.api_max_retries,
+                    backoff_base=self.bot.settings.api_retry_backoff,
+                    validator_details=monitor.get_cached_validator(chain, val_addr) if monitor else None,
+                )
+                for chain, val_addr, chain_config in targets
+            ),
+            return_exceptions=True
+        )
 
-            embed = await create_validator_status_embed(self.bot.user, chain, val_addr, status_info)
+        embeds = []
+        now = datetime.datetime.now(datetime.timezone.utc)
+        for (chain, val_addr, _), status_info in zip(targets, results):
+            if isinstance(status_info, Exception):
+                status_info = ValidatorStatus(success=False, error=str(status_info))
+            embed = create_validator_status_embed(
+                self.bot.user, chain, val_addr, status_info, timestamp=now
+            )
             embeds.append(embed)
 
         if embeds:
@@ -149,19 +174,29 @@ class ValidatorCommands(commands.Cog):
     async def validator_status(
         self, interaction: discord.Interaction, chain_name: str, validator_address: str
     ):
-        await interaction.response.defer(ephemeral=False)
         chain_name = chain_name.lower()
         chain_config = self.bot.supported_chains.get(chain_name)
         if not chain_config:
-            await interaction.followup.send(f"Error: Chain `{chain_name}` is not supported.")
+            await interaction.response.send_message(
+                f"Error: Chain `{chain_name}` is not supported.", ephemeral=True
+            )
             return
 
+        await interaction.response.defer(ephemeral=False)
+
+        await slashing_cache.ensure_slashing_cache(
+            self.bot.async_client, chain_config,
+            max_retries=self.bot.settings.api_max_retries,
+            backoff_base=self.bot.settings.api_retry_backoff,
+        )
         status_info = await get_validator_info(
-            self.bot.async_client, chain_config, validator_address, {}, {},
+            self.bot.async_client, chain_config, validator_address,
+            slashing_cache.get_signing_infos(chain_name),
+            slashing_cache.get_slashing_params(chain_name),
             max_retries=self.bot.settings.api_max_retries,
             backoff_base=self.bot.settings.api_retry_backoff,
         )
-        embed = await create_validator_status_embed(
+        embed = create_validator_status_embed(
             self.bot.user, chain_name, validator_address, status_info
         )
         await interaction.followup.send(embed=embed)
@@ -3,12 +3,18 @@
 """Async database manager using aiosqlite.
 
 All database operations are non-blocking, preventing the bot's async event loop
-from being blocked by I/O operations.
+from being blocked by I/O operations. A single connection is opened on first
+use and reused, so calls don't pay file-open and page cache warm-up costs.
+aiosqlite runs its statements serially on one thread; writes additionally hold
+a lock so that one caller's commit never lands in the middle of another's
+transaction. Together these make the connection the process's single writer.
 """
 
-import datetime
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 import aiosqlite
 
@@ -17,18 +23,126 @@ logger = logging.getLogger(__name__)
 # Module-level database path, set during initialization
 _db_path: str = 'validator_monitor.db'
 
+# chain_name -> active chain notification preferences. Loaded on first read
+# and dropped by set_chain_notification_preference, the only writer. The
+# version stops a read that raced a write from caching what it loaded.
+_notification_prefs_cache: Optional[Dict[str, List[sqlite3.Row]]] = None
+_notification_prefs_version = 0
+
+# Rows for get_all_validators_to_monitor(), kept between ticks and dropped by
+# every write to validators; versioned the same way as the prefs above.
+_workset_cache: Optional[List[Tuple]] = None
+_workset_version = 0
+
+# Shared connection, opened lazily by _get_db() and closed by close_db(). The
+# lock is created on first use so it binds to the bot's running event loop.
+_db: Optional[aiosqlite.Connection] = None
+_write_lock: Optional[asyncio.Lock] = None
+
+# sqlite3 keeps compiled statements per connection, keyed by SQL text. With
+# one long-lived connection every query in this module stays compiled; the
+# size just has to exceed the number of distinct statements used here.
+_STATEMENT_CACHE_SIZE = 128
+
+# UTC ISO-8601 timestamp computed by SQLite, in the same shape as
+# datetime.now(timezone.utc).isoformat() produced before
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')"
+
+# Statements run on every monitoring tick
+_SQL_VALIDATORS_TO_MONITOR = """SELECT chain_name, validator_address, user_id, channel_id,
+          moniker, status, missed_blocks, last_total_stake, mention_type
+   FROM validators WHERE notifications_enabled = 1
+   ORDER BY chain_name"""
+_SQL_UPDATE_VALIDATOR_STATUS = f"""UPDATE validators SET
+       status = ?, missed_blocks = ?, last_check_time = {_SQL_NOW},
+       moniker = COALESCE(?, moniker),
+       last_total_stake = COALESCE(?, last_total_stake)
+   WHERE chain_name = ? AND validator_address = ?"""
+
+# WAL lets readers proceed alongside a writer, but writers are still
+# serialized; _transaction() holds _write_lock so they queue in-process
+# instead of contending for the file lock.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+)
+
 
 def set_db_path(path: str):
     """Set the database file path. Must be called before init_db()."""
-    global _db_path
+    global _db_path, _notification_prefs_cache, _workset_cache
     _db_path = path
+    _notification_prefs_cache = None
+    _workset_cache = None
+
+
+async def _get_db() -> aiosqlite.Connection:
+    """Return the shared connection, opening and configuring it on first use.
+
+    init_db() runs before anything else touches the database, so the first
+    open is never contended.
+    """
+    global _db, _write_lock
+    if _db is None:
+        _write_lock = asyncio.Lock()
+        # IMMEDIATE takes the write lock when a transaction begins rather than on
+        # its first write, so an outside writer (e.g. a backup) makes us wait
+        # for busy_timeout instead of failing a lock upgrade with SQLITE_BUSY.
+        db = await aiosqlite.connect(
+            _db_path, cached_statements=_STATEMENT_CACHE_SIZE, isolation_level="IMMEDIATE"
+        )
+        for pragma in _CONNECTION_PRAGMAS:
+            await db.execute(pragma)
+        _db = db
+    return _db
+
+
+@asynccontextmanager
+async def _transaction() -> AsyncIterator[aiosqlite.Connection]:
+    """Run writes on the shared connection as one transaction.
+
+    Commits on success and rolls back on error.
+    """
+    db = await _get_db()
+    async with _write_lock:
+        try:
+            yield db
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            raise
+
+
+async def optimize_db():
+    """Let SQLite refresh planner statistics for tables whose contents have shifted.
+
+    PRAGMA optimize only re-analyzes where it expects a better plan, so it is
+    cheap enough to run periodically on a long-lived connection.
+    """
+    async with _transaction() as db:
+        await db.execute("PRAGMA optimize")
+
+
+async def close_db():
+    """Optimize and close the shared connection, if open."""
+    global _db
+    if _db is not None:
+        try:
+            await optimize_db()
+        except Exception as e:
+            logger.warning(f"PRAGMA optimize before close failed: {e}")
+        await _db.close()
+        _db = None
 
 
 async def init_db():
     """Initialize the database and create/migrate tables."""
-    async with aiosqlite.connect(_db_path) as db:
-        await db.execute("PRAGMA journal_mode=WAL")
-
+    async with _transaction() as db:
         await db.execute('''
             CREATE TABLE IF NOT EXISTS validators (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -65,9 +179,43 @@ async def init_db():
             );
         ''')
 
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS governance_proposal_cache (
+                chain_name TEXT NOT NULL,
+                proposal_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                PRIMARY KEY (chain_name, proposal_id)
+            );
+        ''')
+
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS upgrade_plan_cache (
+                chain_name TEXT PRIMARY KEY,
+                plan_name TEXT
+            );
+        ''')
+
         # --- Migrations ---
         await _run_migrations(db)
-        await db.commit()
+
+        # --- Indexes ---
+        # validator_address is already covered by its UNIQUE index; these serve
+        # the per-user listings, per-chain lookups and the monitor's scan.
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_val_user_chain ON validators(user_id, chain_name)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_val_chain_addr ON validators(chain_name, validator_address)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_val_chain_channel ON validators(chain_name, channel_id)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_val_notify ON validators(notifications_enabled) "
+            "WHERE notifications_enabled = 1"
+        )
+        # Refresh planner statistics so the new indexes are actually chosen
+        await db.execute("ANALYZE")
     logger.info("Database initialized successfully.")
 
 
@@ -89,125 +237,130 @@ async def _run_migrations(db: aiosqlite.Connection):
 # Validator CRUD Operations
 # =============================================================================
 
+def _invalidate_workset():
+    """Drop the cached monitor work set after a write to validators."""
+    global _workset_cache, _workset_version
+    _workset_cache = None
+    _workset_version += 1
+
+
 async def add_validator(
     user_id: int, channel_id: int, chain_name: str,
     validator_address: str, moniker: str = None,
     mention_type: str = None
 ) -> bool:
     """Add a new validator to monitoring. Returns True if added, False if duplicate."""
-    try:
-        async with aiosqlite.connect(_db_path) as db:
-            await db.execute(
-                """INSERT INTO validators
-                   (user_id, channel_id, chain_name, validator_address, moniker,
-                    status, missed_blocks, last_check_time, mention_type)
-                   VALUES (?, ?, ?, ?, ?, 'UNKNOWN', -1, ?, ?)""",
-                (user_id, channel_id, chain_name, validator_address, moniker,
-                 datetime.datetime.now().isoformat(), mention_type)
-            )
-            await db.commit()
+    async with _transaction() as db:
+        cursor = await db.execute(
+            f"""INSERT OR IGNORE INTO validators
+               (user_id, channel_id, chain_name, validator_address, moniker,
+                mention_type, last_check_time)
+               VALUES (?, ?, ?, ?, ?, ?, {_SQL_NOW})""",
+            (user_id, channel_id, chain_name, validator_address, moniker, mention_type)
+        )
+    if cursor.rowcount > 0:
+        _invalidate_workset()
         return True
-    except aiosqlite.IntegrityError:
-        return False
+    return False
 
 
 async def remove_validator(user_id: int, chain_name: str, validator_address: str) -> bool:
     """Remove a validator from monitoring. Returns True if removed."""
-    async with aiosqlite.connect(_db_path) as db:
+    async with _transaction() as db:
         cursor = await db.execute(
             "DELETE FROM validators WHERE user_id = ? AND chain_name = ? AND validator_address = ?",
             (user_id, chain_name, validator_address)
         )
-        await db.commit()
-        return cursor.rowcount > 0
+    if cursor.rowcount > 0:
+        _invalidate_workset()
+        return True
+    return False
 
 
 async def get_user_validators(user_id: int) -> List[Tuple]:
     """Get all validators registered by a specific user."""
-    async with aiosqlite.connect(_db_path) as db:
-        async with db.execute(
-            "SELECT chain_name, validator_address, moniker, status, missed_blocks "
-            "FROM validators WHERE user_id = ?",
-            (user_id,)
-        ) as cursor:
-            return await cursor.fetchall()
+    db = await _get_db()
+    async with db.execute(
+        "SELECT chain_name, validator_address, moniker, status, missed_blocks "
+        "FROM validators WHERE user_id = ?",
+        (user_id,)
+    ) as cursor:
+        return await cursor.fetchall()
 
 
 async def get_user_validators_by_chain(user_id: int, chain_name: str) -> List[Tuple]:
     """Get validators for a user on a specific chain."""
-    async with aiosqlite.connect(_db_path) as db:
-        async with db.execute(
-            "SELECT chain_name, validator_address, moniker, status, missed_blocks "
-            "FROM validators WHERE user_id = ? AND chain_name = ?",
-            (user_id, chain_name)
-        ) as cursor:
-            return await cursor.fetchall()
+    db = await _get_db()
+    async with db.execute(
+        "SELECT chain_name, validator_address, moniker, status, missed_blocks "
+        "FROM validators WHERE user_id = ? AND chain_name = ?",
+        (user_id, chain_name)
+    ) as cursor:
+        return await cursor.fetchall()
 
 
 async def get_user_validator_details(
     user_id: int, chain_name: str, validator_address: str
 ) -> Optional[Tuple]:
     """Get full details for a specific validator."""
-    async with aiosqlite.connect(_db_path) as db:
-        async with db.execute(
-            "SELECT * FROM validators WHERE user_id = ? AND chain_name = ? AND validator_address = ?",
-            (user_id, chain_name, validator_address)
-        ) as cursor:
-            return await cursor.fetchone()
+    db = await _get_db()
+    async with db.execute(
+        "SELECT chain_name, validator_address, user_id, channel_id, moniker, status, "
+        "missed_blocks, notifications_enabled "
+        "FROM validators WHERE user_id = ? AND chain_name = ? AND validator_address = ?",
+        (user_id, chain_name, validator_address)
+    ) as cursor:
+        return await cursor.fetchone()
 
 
 async def get_all_validators_to_monitor() -> List[Tuple]:
-    """Get all validators with notifications enabled for monitoring."""
-    async with aiosqlite.connect(_db_path) as db:
-        async with db.execute(
-            """SELECT chain_name, validator_address, user_id, channel_id,
-                      moniker, status, missed_blocks, last_total_stake, mention_type
-               FROM validators WHERE notifications_enabled = 1"""
-        ) as cursor:
-            return await cursor.fetchall()
-
-
-async def update_validator_status(
-    chain_name: str, validator_address: str,
-    new_status: str, new_missed_blocks: int,
-    last_check_time: str, moniker: str = None,
-    new_stake: float = None
-) -> None:
-    """Update validator status using a single dynamic query.
+    """Get all validators with notifications enabled, ordered by chain for grouping.
 
-    Replaces the old fragile 4-branch approach with a clean dynamic builder.
+    Served from memory until a write touches validators; treat the list as read-only.
     """
-    fields = ["status = ?", "missed_blocks = ?", "last_check_time = ?"]
-    values: list[Any] = [new_status, new_missed_blocks, last_check_time]
-
-    if moniker is not None:
-        fields.append("moniker = ?")
-        values.append(moniker)
-
-    if new_stake is not None:
-        fields.append("last_total_stake = ?")
-        values.append(new_stake)
-
-    values.extend([chain_name, validator_address])
-    query = f"UPDATE validators SET {', '.join(fields)} WHERE chain_name = ? AND validator_address = ?"
-
-    async with aiosqlite.connect(_db_path) as db:
-        await db.execute(query, values)
-        await db.commit()
+    global _workset_cache
+    if _workset_cache is None:
+        version = _workset_version
+        db = await _get_db()
+        async with db.execute(_SQL_VALIDATORS_TO_MONITOR) as cursor:
+            rows = await cursor.fetchall()
+        if version != _workset_version:
+            return rows
+        _workset_cache = rows
+    return _workset_cache
+
+
+async def bulk_update_validator_status(updates: List[Tuple], chunk_size: int = 50) -> None:
+    """Apply many validator status updates in transactions of up to chunk_size rows.
+
+    Each row is (status, missed_blocks, moniker, new_stake, chain_name,
+    validator_address); last_check_time is stamped by SQLite. A None moniker
+    or new_stake keeps the stored value. The monitor only queues rows whose
+    status, missed blocks, moniker or stake changed, so a steady-state tick
+    writes nothing. Committing per chunk lets command queries queued on the
+    shared connection run between chunks instead of waiting out one long
+    transaction.
+    """
+    for start in range(0, len(updates), chunk_size):
+        async with _transaction() as db:
+            await db.executemany(_SQL_UPDATE_VALIDATOR_STATUS, updates[start:start + chunk_size])
+        _invalidate_workset()
 
 
 async def set_validator_notifications(
     user_id: int, chain_name: str, validator_address: str, enabled: bool
 ) -> bool:
     """Toggle notification status for a specific validator."""
-    async with aiosqlite.connect(_db_path) as db:
+    async with _transaction() as db:
         cursor = await db.execute(
             "UPDATE validators SET notifications_enabled = ? "
             "WHERE user_id = ? AND chain_name = ? AND validator_address = ?",
             (1 if enabled else 0, user_id, chain_name, validator_address)
         )
-        await db.commit()
-        return cursor.rowcount > 0
+    if cursor.rowcount > 0:
+        _invalidate_workset()
+        return True
+    return False
 
 
 # =============================================================================
@@ -219,8 +372,9 @@ async def set_chain_notification_preference(
     notify_gov: bool, notify_upgrade: bool, mention_type: str
 ) -> bool:
     """Set or update notification preferences for a channel+chain combination."""
+    global _notification_prefs_cache, _notification_prefs_version
     try:
-        async with aiosqlite.connect(_db_path) as db:
+        async with _transaction() as db:
             await db.execute(
                 """INSERT INTO chain_notification_settings
                    (channel_id, chain_name, notify_gov_enabled, notify_upgrade_enabled, mention_type)
@@ -232,49 +386,59 @@ async def set_chain_notification_preference(
                 (channel_id, chain_name, 1 if notify_gov else 0,
                  1 if notify_upgrade else 0, mention_type)
             )
-            await db.commit()
+        _notification_prefs_cache = None
+        _notification_prefs_version += 1
         return True
     except Exception as e:
         logger.error(f"Error setting chain notification preference: {e}")
         return False
 
 
-async def get_chain_notification_preferences(chain_name: str) -> List[Dict]:
-    """Get all channels configured to receive notifications for a chain."""
-    async with aiosqlite.connect(_db_path) as db:
-        db.row_factory = aiosqlite.Row
+async def _get_notification_prefs() -> Dict[str, List[sqlite3.Row]]:
+    """Return active notification preferences by chain, querying only after a write."""
+    global _notification_prefs_cache
+    if _notification_prefs_cache is None:
+        version = _notification_prefs_version
+        prefs: Dict[str, List[sqlite3.Row]] = {}
+        db = await _get_db()
         async with db.execute(
-            """SELECT channel_id, notify_gov_enabled, notify_upgrade_enabled, mention_type
+            """SELECT chain_name, channel_id, notify_gov_enabled, notify_upgrade_enabled, mention_type
                FROM chain_notification_settings
-               WHERE chain_name = ? AND (notify_gov_enabled = 1 OR notify_upgrade_enabled = 1)""",
-            (chain_name,)
+               WHERE notify_gov_enabled = 1 OR notify_upgrade_enabled = 1"""
         ) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+            cursor.row_factory = sqlite3.Row
+            async for config in cursor:
+                prefs.setdefault(config['chain_name'], []).append(config)
+        if version != _notification_prefs_version:
+            return prefs
+        _notification_prefs_cache = prefs
+    return _notification_prefs_cache
+
+
+async def get_chain_notification_preferences(chain_name: str) -> List[sqlite3.Row]:
+    """Get all channels configured to receive notifications for a chain.
+
+    Served from an in-memory view of rows addressable by column name.
+    """
+    return (await _get_notification_prefs()).get(chain_name, [])
 
 
 async def get_all_chain_notification_chains() -> List[str]:
     """Get all unique chain names with active notification settings."""
-    async with aiosqlite.connect(_db_path) as db:
-        async with db.execute(
-            """SELECT DISTINCT chain_name FROM chain_notification_settings
-               WHERE notify_gov_enabled = 1 OR notify_upgrade_enabled = 1"""
-        ) as cursor:
-            return [row[0] async for row in cursor]
+    return list(await _get_notification_prefs())
 
 
-async def get_channels_with_validator_count(chain_name: str) -> List[Dict]:
+async def get_channels_with_validator_count(chain_name: str) -> List[sqlite3.Row]:
     """Get channels with validator counts for a specific chain."""
-    async with aiosqlite.connect(_db_path) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(
-            """SELECT channel_id, COUNT(id) as validator_count
-               FROM validators WHERE chain_name = ?
-               GROUP BY channel_id ORDER BY validator_count DESC""",
-            (chain_name,)
-        ) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+    db = await _get_db()
+    async with db.execute(
+        """SELECT channel_id, COUNT(id) as validator_count
+           FROM validators WHERE chain_name = ?
+           GROUP BY channel_id ORDER BY validator_count DESC""",
+        (chain_name,)
+    ) as cursor:
+        cursor.row_factory = sqlite3.Row
+        return await cursor.fetchall()
 
 
 # =============================================================================
@@ -283,67 +447,119 @@ async def get_channels_with_validator_count(chain_name: str) -> List[Dict]:
 
 async def get_runtime_setting(key: str) -> Optional[str]:
     """Get a persisted runtime setting value."""
-    async with aiosqlite.connect(_db_path) as db:
-        async with db.execute(
-            "SELECT value FROM bot_runtime_settings WHERE key = ?", (key,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            return row[0] if row else None
+    db = await _get_db()
+    async with db.execute(
+        "SELECT value FROM bot_runtime_settings WHERE key = ?", (key,)
+    ) as cursor:
+        row = await cursor.fetchone()
+        return row[0] if row else None
 
 
 async def set_runtime_setting(key: str, value: str) -> None:
     """Persist a runtime setting value."""
-    async with aiosqlite.connect(_db_path) as db:
+    async with _transaction() as db:
         await db.execute(
             """INSERT INTO bot_runtime_settings (key, value) VALUES (?, ?)
                ON CONFLICT(key) DO UPDATE SET value = excluded.value""",
             (key, value)
         )
-        await db.commit()
 
 
 async def get_all_runtime_settings() -> Dict[str, str]:
     """Get all persisted runtime settings."""
-    async with aiosqlite.connect(_db_path) as db:
-        async with db.execute("SELECT key, value FROM bot_runtime_settings") as cursor:
-            return {row[0]: row[1] async for row in cursor}
+    db = await _get_db()
+    async with db.execute("SELECT key, value FROM bot_runtime_settings") as cursor:
+        return {row[0]: row[1] async for row in cursor}
 
 
 # =============================================================================
-# Statistics
+# Governance / Upgrade Monitor State (survives restarts)
 # =============================================================================
 
-async def get_monitoring_stats() -> Dict[str, int]:
-    """Get aggregated monitoring statistics for the bot status dashboard."""
-    async with aiosqlite.connect(_db_path) as db:
-        stats = {}
+async def get_governance_proposal_cache() -> Dict[str, Dict[str, str]]:
+    """Get the last seen proposal statuses, as {chain_name: {proposal_id: status}}."""
+    cache: Dict[str, Dict[str, str]] = {}
+    db = await _get_db()
+    async with db.execute(
+        "SELECT chain_name, proposal_id, status FROM governance_proposal_cache"
+    ) as cursor:
+        async for chain_name, proposal_id, status in cursor:
+            cache.setdefault(chain_name, {})[proposal_id] = status
+    return cache
 
-        async with db.execute("SELECT COUNT(*) FROM validators") as c:
-            stats['total_validators'] = (await c.fetchone())[0]
 
-        async with db.execute(
-            "SELECT COUNT(*) FROM validators WHERE notifications_enabled = 1"
-        ) as c:
-            stats['active_validators'] = (await c.fetchone())[0]
+async def save_governance_proposal_cache(
+    changed: Iterable[Tuple[str, str, str]], removed: Iterable[Tuple[str, str]] = ()
+) -> None:
+    """Upsert changed proposal statuses and drop proposals no longer listed, in one transaction.
 
-        async with db.execute(
-            "SELECT COUNT(DISTINCT chain_name) FROM validators"
-        ) as c:
-            stats['unique_chains'] = (await c.fetchone())[0]
+    Rows are (chain_name, proposal_id, status) and (chain_name, proposal_id),
+    so one tick's changes across all chains are written together.
+    """
+    async with _transaction() as db:
+        await db.executemany(
+            """INSERT OR REPLACE INTO governance_proposal_cache (chain_name, proposal_id, status)
+               VALUES (?, ?, ?)""",
+            changed
+        )
+        await db.executemany(
+            "DELETE FROM governance_proposal_cache WHERE chain_name = ? AND proposal_id = ?",
+            removed
+        )
 
-        async with db.execute(
-            "SELECT COUNT(DISTINCT user_id) FROM validators"
-        ) as c:
-            stats['unique_users'] = (await c.fetchone())[0]
 
-        async with db.execute(
-            "SELECT COUNT(*) FROM validators WHERE status = 'JAILED'"
-        ) as c:
-            stats['jailed_validators'] = (await c.fetchone())[0]
+async def get_upgrade_plan_cache() -> Dict[str, Optional[str]]:
+    """Get the last seen upgrade plan name per chain."""
+    db = await _get_db()
+    async with db.execute("SELECT chain_name, plan_name FROM upgrade_plan_cache") as cursor:
+        return {row[0]: row[1] async for row in cursor}
+
+
+async def save_upgrade_plans(plans: Dict[str, Optional[str]]) -> None:
+    """Persist current upgrade plan names (None if no plan) for several chains at once."""
+    async with _transaction() as db:
+        await db.executemany(
+            """INSERT INTO upgrade_plan_cache (chain_name, plan_name) VALUES (?, ?)
+               ON CONFLICT(chain_name) DO UPDATE SET plan_name = excluded.plan_name""",
+            plans.items()
+        )
 
-        async with db.execute(
-            "SELECT COUNT(*) FROM validators WHERE status = 'API_ERROR'"
-        ) as c:
-            stats['api_error_validators'] = (await c.fetchone())[0]
 
-        return stats
+# =============================================================================
+# Statistics
+# =============================================================================
+
+async def get_monitoring_stats() -> Dict[str, int]:
+    """Get aggregated monitoring statistics for the bot status dashboard."""
+    db = await _get_db()
+    stats = {}
+
+    async with db.execute("SELECT COUNT(*) FROM validators") as c:
+        stats['total_validators'] = (await c.fetchone())[0]
+
+    async with db.execute(
+        "SELECT COUNT(*) FROM validators WHERE notifications_enabled = 1"
+    ) as c:
+        stats['active_validators'] = (await c.fetchone())[0]
+
+    async with db.execute(
+        "SELECT COUNT(DISTINCT chain_name) FROM validators"
+    ) as c:
+        stats['unique_chains'] = (await c.fetchone())[0]
+
+    async with db.execute(
+        "SELECT COUNT(DISTINCT user_id) FROM validators"
+    ) as c:
+        stats['unique_users'] = (await c.fetchone())[0]
+
+    async with db.execute(
+        "SELECT COUNT(*) FROM validators WHERE status = 'JAILED'"
+    ) as c:
+        stats['jailed_validators'] = (await c.fetchone())[0]
+
+    async with db.execute(
+        "SELECT COUNT(*) FROM validators WHERE status = 'API_ERROR'"
+    ) as c:
+        stats['api_error_validators'] = (await c.fetchone())[0]
+
+    return stats
@@ -5,12 +5,16 @@
 import logging
 import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# String values accepted as True when coercing boolean settings
+_TRUTHY_STRINGS = frozenset({'true', '1', 'yes'})
+
 
 @dataclass
 class ChainConfig:
@@ -35,14 +39,49 @@ class ChainConfig:
         filtered = {k: v for k, v in data.items() if k in known_fields}
         return cls(name=name, **filtered)
 
+    # Full endpoint URLs, built once per config instead of on every poll
+    @cached_property
+    def slashing_params_url(self) -> str:
+        return f"{self.rest_api_url}{self.slashing_params_endpoint}"
+
+    @cached_property
+    def signing_infos_url(self) -> str:
+        return f"{self.rest_api_url}{self.signing_infos_endpoint}"
+
+    @cached_property
+    def gov_proposals_url(self) -> str:
+        return f"{self.rest_api_url}{self.gov_proposals_endpoint}"
+
+    @cached_property
+    def voting_proposals_url(self) -> str:
+        # proposal_status=2 is PROPOSAL_STATUS_VOTING_PERIOD, filtered by the node
+        sep = '&' if '?' in self.gov_proposals_endpoint else '?'
+        return f"{self.gov_proposals_url}{sep}proposal_status=2&pagination.limit=25"
+
+    @cached_property
+    def current_plan_url(self) -> str:
+        return f"{self.rest_api_url}{self.current_plan_endpoint}"
+
+    @cached_property
+    def staking_validators_url(self) -> str:
+        return f"{self.rest_api_url}/cosmos/staking/v1beta1/validators"
+
+    @cached_property
+    def token_unit(self) -> int:
+        """Base-denom amount per whole token."""
+        return 10 ** self.decimals
+
     def get_gov_version(self) -> str:
         """Determine gov API version from endpoint."""
         return "v1" if "/gov/v1/" in self.gov_proposals_endpoint else "v1beta1"
 
+    @cached_property
+    def _gov_proposal_url_prefix(self) -> str:
+        return f"{self.rest_api_url}/cosmos/gov/{self.get_gov_version()}/proposals/"
+
     def get_tally_endpoint(self, prop_id: str) -> str:
         """Build full tally URL for a proposal."""
-        version = self.get_gov_version()
-        return f"{self.rest_api_url}/cosmos/gov/{version}/proposals/{prop_id}/tally"
+        return f"{self._gov_proposal_url_prefix}{prop_id}/tally"
 
 
 @dataclass
@@ -59,6 +98,7 @@ class BotSettings:
     api_timeout: float = 20.0
     api_max_retries: int = 3
     api_retry_backoff: float = 2.0
+    max_concurrent_checks: int = 10
     admin_user_ids: List[int] = field(default_factory=list)
 
     # Keys that are safe to modify at runtime via Discord commands
@@ -66,7 +106,7 @@ class BotSettings:
         'monitor_interval_seconds', 'governance_check_interval_seconds',
         'upgrade_check_interval_seconds', 'missed_blocks_threshold',
         'min_stake_change_amount', 'api_timeout', 'api_max_retries',
-        'api_retry_backoff', 'log_level',
+        'api_retry_backoff', 'max_concurrent_checks', 'log_level',
     }
 
     @classmethod
@@ -84,7 +124,7 @@ class BotSettings:
         current = getattr(self, key)
         try:
             if isinstance(current, bool):
-                value = str(value).lower() in ('true', '1', 'yes')
+                value = str(value).strip().lower() in _TRUTHY_STRINGS
             elif isinstance(current, int):
                 value = int(value)
             elif isinstance(current, float):
@@ -94,6 +134,10 @@ class BotSettings:
         except (ValueError, TypeError):
             return False
 
+        # Zero slots would block every validator check; negatives can't size a semaphore
+        if key == 'max_concurrent_checks' and value < 1:
+            return False
+
         setattr(self, key, value)
         return True
 
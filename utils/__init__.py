@@ -5,6 +5,8 @@
 from discord import app_commands
 import discord
 
+import db_manager
+
 
 async def chain_autocomplete(interaction: discord.Interaction, current: str):
     """Autocomplete callback for chain_name parameters across all commands."""
@@ -17,7 +19,6 @@ async def chain_autocomplete(interaction: discord.Interaction, current: str):
 
 async def user_validator_autocomplete(interaction: discord.Interaction, current: str):
     """Autocomplete callback for validator_address based on user's registered validators."""
-    import db_manager
     validators = await db_manager.get_user_validators(interaction.user.id)
     results = []
     for chain, addr, moniker, status, _ in validators:
@@ -2,40 +2,100 @@
 # -*- coding: utf-8 -*-
 """API helper functions for fetching and processing chain data."""
 
+import asyncio
 import base64
 import hashlib
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional
+from urllib.parse import quote
 
 import httpx
-from bech32 import bech32_encode, convertbits
+import orjson
+from bech32 import bech32_encode
 
-from utils.retry import api_get_with_retry
+from utils.retry import api_get_coalesced, api_get_with_retry
+from utils.slashing_cache import SlashingParams
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on simultaneous validator lookups against a single REST host
+MAX_CONCURRENT_REQUESTS_PER_HOST = 8
+
+# Page size for bulk validator set fetches
+VALIDATOR_SET_PAGE_LIMIT = 500
+
+# Display names for staking API bond statuses
+BOND_STATUS_LABELS = {
+    "BOND_STATUS_BONDED": "Bonded",
+    "BOND_STATUS_UNBONDING": "Unbonding",
+    "BOND_STATUS_UNBONDED": "Unbonded",
+}
+
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+class ValidatorStatus(NamedTuple):
+    """Result of get_validator_info; on failure only success and error are set."""
+    success: bool
+    moniker: str = 'N/A'
+    status: str = 'N/A'
+    jailed: bool = False
+    missed_blocks: int = -1
+    total_stake: str = 'N/A'
+    raw_stake: float = 0.0
+    estimated_uptime: str = 'N/A'
+    estimated_uptime_percentage: float = 0.0
+    error: Optional[str] = None
+
+
+def get_host_semaphore(url: str) -> asyncio.Semaphore:
+    """Return the shared concurrency limiter for the host of a REST URL."""
+    host = httpx.URL(url).host
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        semaphore = _host_semaphores[host] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS_PER_HOST)
+    return semaphore
+
+
+@lru_cache(maxsize=None)
+def _progress_bars(length: int) -> tuple:
+    """Every bar of a given length, indexed by filled cells; the last entry is the blank bar."""
+    return tuple(f"[{'█' * filled}{'░' * (length - filled)}]" for filled in range(length + 1)) + (
+        f"[{' ' * length}]",
+    )
+
 
 def create_progress_bar(percentage: float, length: int = 20) -> str:
     """Create a text-based progress bar from a percentage value."""
+    bars = _progress_bars(length)
     if not 0 <= percentage <= 100:
-        return f"[{' ' * length}]"
+        return bars[-1]
+    return bars[int(length * percentage // 100)]
+
 
-    filled_length = int(length * percentage // 100)
-    bar = '█' * filled_length + '░' * (length - filled_length)
-    return f"[{bar}]"
+def _address_to_5bit_groups(address_bytes: bytes) -> list:
+    """Regroup a 20-byte address into 32 five-bit values (bech32 convertbits 8 -> 5).
 
+    160 bits split evenly into 5-bit groups, so no padding is involved and the
+    generic bit-accumulator loop reduces to shifts over one integer.
+    """
+    value = int.from_bytes(address_bytes, 'big')
+    return [(value >> shift) & 0x1f for shift in range(155, -1, -5)]
 
+
+@lru_cache(maxsize=4096)
 def pubkey_to_consensus_address(pubkey_b64: str, valcons_prefix: str) -> Optional[str]:
-    """Convert a base64 public key to a bech32 consensus address."""
+    """Convert a base64 public key to a bech32 consensus address.
+
+    Memoized: the result depends only on the arguments, and a validator's
+    pubkey is the same on every tick.
+    """
     try:
         pubkey_bytes = base64.b64decode(pubkey_b64)
         sha256_hash = hashlib.sha256(pubkey_bytes).digest()
-        address_bytes = sha256_hash[:20]
-        converted_bits = convertbits(address_bytes, 8, 5)
-        if converted_bits is None:
-            return None
-        return bech32_encode(valcons_prefix, converted_bits)
-    except Exception as e:
+        return bech32_encode(valcons_prefix, _address_to_5bit_groups(sha256_hash[:20]))
+    except ValueError as e:  # includes binascii.Error from malformed base64
         logger.error(f"Error in pubkey_to_consensus_address for {pubkey_b64}: {e}")
         return None
 
@@ -45,62 +105,73 @@ async def get_validator_info(
     chain_config,
     validator_address: str,
     slashing_info_cache: dict,
-    slashing_params_cache: dict,
+    slashing_params: Optional[SlashingParams],
     max_retries: int = 3,
     backoff_base: float = 2.0,
-) -> dict:
+    validator_details: Optional[dict] = None,
+) -> ValidatorStatus:
     """Fetch and process detailed validator information from the chain API.
 
     Uses retry logic for resilient API calls. Accepts ChainConfig dataclass
-    with attribute-style access.
+    with attribute-style access. Concurrent calls against the same REST host
+    are capped at MAX_CONCURRENT_REQUESTS_PER_HOST to avoid 429s when
+    callers fan out with asyncio.gather.
 
     Args:
         async_client: The httpx async client.
         chain_config: ChainConfig dataclass instance.
         validator_address: The validator's operator address.
-        slashing_info_cache: Cached slashing signing info keyed by consensus address.
-        slashing_params_cache: Cached slashing parameters.
+        slashing_info_cache: Cached SigningInfo entries keyed by consensus address.
+        slashing_params: Cached slashing parameters, or None if unavailable.
         max_retries: Maximum retry attempts for API calls.
         backoff_base: Base for exponential backoff.
+        validator_details: Staking API validator object, if already fetched
+            (e.g. via fetch_validator_set). Skips the per-validator request.
 
     Returns:
-        Dict with validator info. Always has 'success' key.
+        A ValidatorStatus; failures are reported via success/error, not raised.
     """
     rest_api_url = chain_config.rest_api_url
     valcons_prefix = chain_config.valcons_prefix
     token_symbol = chain_config.token_symbol
-    token_decimals = chain_config.decimals
     missed_blocks_supported = chain_config.missed_blocks_supported
 
     try:
-        staking_url = f"{rest_api_url}/cosmos/staking/v1beta1/validators/{validator_address}"
-        staking_response = await api_get_with_retry(
-            async_client, staking_url,
-            max_retries=max_retries, backoff_base=backoff_base
-        )
-        validator_details = staking_response.json()['validator']
+        if validator_details is None:
+            staking_url = f"{chain_config.staking_validators_url}/{validator_address}"
+            async with get_host_semaphore(rest_api_url):
+                staking_response = await api_get_coalesced(
+                    async_client, staking_url,
+                    max_retries=max_retries, backoff_base=backoff_base
+                )
+            validator_details = orjson.loads(staking_response.content)['validator']
 
         moniker = validator_details['description']['moniker']
         jailed = validator_details['jailed']
-        status = "JAILED" if jailed else {
-            "BOND_STATUS_BONDED": "Bonded",
-            "BOND_STATUS_UNBONDING": "Unbonding",
-            "BOND_STATUS_UNBONDED": "Unbonded"
-        }.get(validator_details['status'], validator_details['status'])
+        status = "JAILED" if jailed else BOND_STATUS_LABELS.get(
+            validator_details['status'], validator_details['status']
+        )
 
         raw_tokens_str = validator_details.get(
             'tokens', validator_details.get('delegator_shares', '0')
         )
+        # raw_stake stays the float of the full amount to match the REAL
+        # column it is compared against. Base-denom amounts routinely exceed
+        # float precision, so the display value is rounded to cents in
+        # integer arithmetic.
         raw_tokens_float = float(raw_tokens_str)
+        raw_tokens = int(raw_tokens_str.partition('.')[0])
 
         # Convert to human-readable format
-        total_stake_human = f"{raw_tokens_float / (10**token_decimals):,.2f} {token_symbol}"
+        unit = chain_config.token_unit
+        whole, cents = divmod((raw_tokens * 100 + unit // 2) // unit, 100)
+        total_stake_human = f"{whole:,}.{cents:02d} {token_symbol}"
 
         missed_blocks = -1
         estimated_uptime = "N/A"
         estimated_uptime_percentage = 0.0
 
-        if missed_blocks_supported and slashing_info_cache and slashing_params_cache:
+        if missed_blocks_supported and slashing_info_cache and slashing_params:
             consensus_pubkey_b64 = validator_details['consensus_pubkey']['key']
             validator_cons_address = pubkey_to_consensus_address(
                 consensus_pubkey_b64, valcons_prefix
@@ -109,10 +180,8 @@ async def get_validator_info(
             if validator_cons_address:
                 slashing_data = slashing_info_cache.get(validator_cons_address)
                 if slashing_data:
-                    missed_blocks = int(slashing_data.get('missed_blocks_counter', -1))
-                    signed_blocks_window = int(
-                        slashing_params_cache.get('signed_blocks_window', '0')
-                    )
+                    missed_blocks = slashing_data.missed_blocks_counter
+                    signed_blocks_window = slashing_params.signed_blocks_window
                     if signed_blocks_window > 0 and missed_blocks >= 0:
                         uptime_percentage = (
                             (signed_blocks_window - missed_blocks) / signed_blocks_window
@@ -120,41 +189,76 @@ async def get_validator_info(
                         estimated_uptime = f"{uptime_percentage:.2f}%"
                         estimated_uptime_percentage = uptime_percentage
 
-        return {
-            'success': True,
-            'moniker': moniker,
-            'status': status,
-            'jailed': jailed,
-            'missed_blocks': missed_blocks,
-            'total_stake': total_stake_human,
-            'raw_stake': raw_tokens_float,
-            'estimated_uptime': estimated_uptime,
-            'estimated_uptime_percentage': estimated_uptime_percentage
-        }
+        return ValidatorStatus(
+            success=True,
+            moniker=moniker,
+            status=status,
+            jailed=jailed,
+            missed_blocks=missed_blocks,
+            total_stake=total_stake_human,
+            raw_stake=raw_tokens_float,
+            estimated_uptime=estimated_uptime,
+            estimated_uptime_percentage=estimated_uptime_percentage,
+        )
 
+    except httpx.HTTPStatusError as e:
+        logger.error(f"API request failed for {validator_address}: {e}")
+        return ValidatorStatus(success=False, error=f"API error: HTTP {e.response.status_code}")
     except httpx.RequestError as e:
         logger.error(f"API request failed for {validator_address}: {e}")
-        return {'success': False, 'error': f"Network error: {e}"}
+        return ValidatorStatus(success=False, error=f"Network error: {e}")
     except (KeyError, ValueError) as e:
         logger.error(f"Data structure mismatch for {validator_address}: {e}")
-        return {'success': False, 'error': "Validator not found or data format is invalid."}
-    except Exception as e:
-        logger.error(f"Unexpected error in get_validator_info for {validator_address}: {e}")
-        return {'success': False, 'error': "An unexpected error occurred."}
+        return ValidatorStatus(success=False, error="Validator not found or data format is invalid.")
+    except Exception:
+        # Anything else is a bug; keep the traceback so it surfaces in the logs
+        logger.exception(f"Unexpected error in get_validator_info for {validator_address}")
+        return ValidatorStatus(success=False, error="An unexpected error occurred.")
+
+
+async def fetch_validator_set(
+    async_client: httpx.AsyncClient,
+    chain_config,
+    max_retries: int = 3,
+    backoff_base: float = 2.0,
+) -> Dict[str, dict]:
+    """Fetch every validator on a chain in bulk, keyed by operator address.
+
+    Follows pagination.next_key so chains larger than one page are covered.
+    Raises on request failure; callers fall back to per-validator lookups.
+    """
+    rest_api_url = chain_config.rest_api_url
+    base_url = f"{chain_config.staking_validators_url}?pagination.limit={VALIDATOR_SET_PAGE_LIMIT}"
+
+    validators: Dict[str, dict] = {}
+    next_key = None
+    while True:
+        url = f"{base_url}&pagination.key={quote(next_key)}" if next_key else base_url
+        async with get_host_semaphore(rest_api_url):
+            response = await api_get_with_retry(
+                async_client, url, max_retries=max_retries, backoff_base=backoff_base
+            )
+        data = orjson.loads(response.content)
+        for validator in data.get('validators', []):
+            validators[validator['operator_address']] = validator
+
+        next_key = (data.get('pagination') or {}).get('next_key')
+        if not next_key:
+            return validators
 
 
 async def get_latest_block_height(
     async_client: httpx.AsyncClient, rest_api_url: str,
-    max_retries: int = 2
+    max_retries: int = 2, backoff_base: float = 2.0
 ) -> Optional[int]:
     """Fetch the latest block height for a chain."""
     try:
-        response = await api_get_with_retry(
+        response = await api_get_coalesced(
             async_client,
             f"{rest_api_url}/cosmos/base/tendermint/v1beta1/blocks/latest",
-            max_retries=max_retries
+            max_retries=max_retries, backoff_base=backoff_base
         )
-        data = response.json()
+        data = orjson.loads(response.content)
         return int(data['block']['header']['height'])
     except Exception as e:
         logger.error(f"Error fetching latest block height from {rest_api_url}: {e}")
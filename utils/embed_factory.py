@@ -3,61 +3,73 @@
 """Factory functions for creating standardized Discord embeds."""
 
 import datetime
-from typing import Dict
+from typing import Optional
 
 import discord
 
-from .api_helpers import create_progress_bar
+from .api_helpers import ValidatorStatus, create_progress_bar
 
 
-async def create_validator_status_embed(
-    bot_user: discord.User, chain_name: str, val_addr: str, status_info: Dict
+# Field layout for the validator status embed: (name, inline)
+_STATUS_FIELDS = (
+    ("Status", True),
+    ("Jailed", True),
+    ("Missed Blocks", True),
+    ("Total Stake", True),
+    ("Estimated Uptime", False),
+)
+
+
+def create_validator_status_embed(
+    bot_user: discord.User, chain_name: str, val_addr: str, status_info: ValidatorStatus,
+    timestamp: Optional[datetime.datetime] = None
 ) -> discord.Embed:
-    """Create a Discord embed from validator status information."""
-    if status_info.get('success'):
-        color = discord.Color.red() if status_info.get('jailed') else discord.Color.blue()
-
-        embed = discord.Embed(
-            title=f"Validator Status: {status_info.get('moniker', 'N/A')}",
-            description=f"Chain: **{chain_name.upper()}**\nAddress: `{val_addr}`",
-            color=color,
-            timestamp=datetime.datetime.now(datetime.timezone.utc)
-        )
-        embed.add_field(name="Status", value=status_info.get('status', 'N/A'), inline=True)
-        embed.add_field(
-            name="Jailed",
-            value="Yes" if status_info.get('jailed') else "No",
-            inline=True
-        )
+    """Create a Discord embed from validator status information.
+
+    The embed is built as a single payload dict via ``Embed.from_dict`` from
+    the static field layout instead of through repeated ``add_field`` calls.
+    Pass ``timestamp`` to share one "now" across a batch of embeds.
+    """
+    if timestamp is None:
+        timestamp = datetime.datetime.now(datetime.timezone.utc)
+    timestamp = timestamp.isoformat()
+
+    if status_info.success:
+        color = discord.Color.red() if status_info.jailed else discord.Color.blue()
 
         missed_blocks_val = "N/A"
-        if (mb := status_info.get('missed_blocks', -1)) != -1:
+        if (mb := status_info.missed_blocks) != -1:
             missed_blocks_val = str(mb)
-        embed.add_field(name="Missed Blocks", value=missed_blocks_val, inline=True)
 
-        embed.add_field(
-            name="Total Stake",
-            value=status_info.get('total_stake', 'N/A'),
-            inline=True
+        uptime_bar = create_progress_bar(status_info.estimated_uptime_percentage)
+        values = (
+            status_info.status,
+            "Yes" if status_info.jailed else "No",
+            missed_blocks_val,
+            status_info.total_stake,
+            f"`{uptime_bar}` **{status_info.estimated_uptime}**",
         )
 
-        uptime_perc = status_info.get('estimated_uptime_percentage', 0.0)
-        uptime_bar = create_progress_bar(uptime_perc)
-        embed.add_field(
-            name="Estimated Uptime",
-            value=f"`{uptime_bar}` **{status_info.get('estimated_uptime', 'N/A')}**",
-            inline=False
-        )
+        payload = {
+            'title': f"Validator Status: {status_info.moniker}",
+            'description': f"Chain: **{chain_name.upper()}**\nAddress: `{val_addr}`",
+            'color': color.value,
+            'timestamp': timestamp,
+            'fields': [
+                {'name': name, 'value': value, 'inline': inline}
+                for (name, inline), value in zip(_STATUS_FIELDS, values)
+            ],
+        }
     else:
-        embed = discord.Embed(
-            title="🔴 Error: Validator Data Retrieval Failed",
-            description=(
+        payload = {
+            'title': "🔴 Error: Validator Data Retrieval Failed",
+            'description': (
                 f"Could not retrieve status for `{val_addr}` on **{chain_name.upper()}**.\n"
-                f"**Reason:** `{status_info.get('error', 'Unknown error')}`"
+                f"**Reason:** `{status_info.error or 'Unknown error'}`"
             ),
-            color=discord.Color.dark_red(),
-            timestamp=datetime.datetime.now(datetime.timezone.utc)
-        )
+            'color': discord.Color.dark_red().value,
+            'timestamp': timestamp,
+        }
 
-    embed.set_footer(text=f"Monitored by {bot_user.name}")
-    return embed
\ No newline at end of file
+    payload['footer'] = {'text': f"Monitored by {bot_user.name}"}
+    return discord.Embed.from_dict(payload)
@@ -7,16 +7,25 @@ building to eliminate code duplication across cogs.
 """
 
 import base64
-import json
+import datetime
 import logging
 from typing import Optional
 
 import httpx
+import orjson
 
-from utils.retry import api_get_with_retry
+from utils.retry import api_get_coalesced
 
 logger = logging.getLogger(__name__)
 
+# Proposal statuses still open for votes, and ones that will never change again
+ACTIVE_PROPOSAL_STATUSES = frozenset({"PROPOSAL_STATUS_VOTING_PERIOD"})
+FINAL_PROPOSAL_STATUSES = frozenset({
+    "PROPOSAL_STATUS_PASSED",
+    "PROPOSAL_STATUS_REJECTED",
+    "PROPOSAL_STATUS_FAILED",
+})
+
 
 def extract_proposal_title(prop_data: dict) -> str:
     """Extract proposal title from various Cosmos gov API formats.
@@ -36,7 +45,7 @@ def extract_proposal_title(prop_data: dict) -> str:
     # Try base64-encoded metadata
     if not title and 'metadata' in prop_data:
         try:
-            metadata_json = json.loads(base64.b64decode(prop_data['metadata']))
+            metadata_json = orjson.loads(base64.b64decode(prop_data['metadata']))
             title = metadata_json.get('title')
         except Exception:
             pass
@@ -44,10 +53,63 @@ def extract_proposal_title(prop_data: dict) -> str:
     return title or f"Proposal #{prop_id}"
 
 
+def format_discord_timestamp(iso_str: Optional[str], style: str = 'R') -> Optional[str]:
+    """Convert a Cosmos RFC 3339 timestamp into a Discord <t:...> tag.
+
+    Returns None if the value is missing or cannot be parsed.
+    """
+    if not iso_str:
+        return None
+    try:
+        if iso_str.endswith('Z') and len(iso_str) >= 20:
+            # Fast path for UTC: Discord tags have whole-second precision, so
+            # parse only 'YYYY-MM-DDTHH:MM:SS'. This also sidesteps nanosecond
+            # fractions, which fromisoformat rejects before Python 3.11.
+            dt = datetime.datetime.fromisoformat(iso_str[:19]).replace(
+                tzinfo=datetime.timezone.utc
+            )
+        else:
+            dt = datetime.datetime.fromisoformat(iso_str)
+    except ValueError:
+        return None
+    return f"<t:{int(dt.timestamp())}:{style}>"
+
+
+def parse_tally(tally_data: dict) -> dict:
+    """Normalize a gov v1 or v1beta1 tally object to 'yes'/'no'/'veto'/'abstain'/'total' ints."""
+    yes = int(tally_data.get('yes_count', tally_data.get('yes', '0')))
+    no = int(tally_data.get('no_count', tally_data.get('no', '0')))
+    veto = int(tally_data.get('no_with_veto_count', tally_data.get('no_with_veto', '0')))
+    abstain = int(tally_data.get('abstain_count', tally_data.get('abstain', '0')))
+    total = yes + no + veto + abstain
+
+    return {'yes': yes, 'no': no, 'veto': veto, 'abstain': abstain, 'total': total}
+
+
+def proposal_updates_slashing_params(prop_data: dict) -> bool:
+    """Check whether a proposal changes slashing params.
+
+    Covers gov v1 messages (e.g. /cosmos.slashing.v1beta1.MsgUpdateParams) and
+    legacy ParameterChangeProposal content, both top-level (gov v1beta1) and
+    wrapped in MsgExecLegacyContent.
+    """
+    messages = prop_data.get('messages') or []
+    if any('.slashing.' in msg.get('@type', '') for msg in messages):
+        return True
+
+    contents = [prop_data.get('content')] + [msg.get('content') for msg in messages]
+    return any(
+        change.get('subspace') == 'slashing'
+        for content in contents if content
+        for change in content.get('changes') or []
+    )
+
+
 async def fetch_tally(
     client: httpx.AsyncClient,
     tally_url: str,
     max_retries: int = 2,
+    backoff_base: float = 2.0,
 ) -> dict:
     """Fetch and parse tally results for a governance proposal.
 
@@ -56,16 +118,10 @@ async def fetch_tally(
         Returns empty dict on failure.
     """
     try:
-        response = await api_get_with_retry(client, tally_url, max_retries=max_retries)
-        tally_data = response.json().get('tally', {})
-
-        yes = int(tally_data.get('yes_count', tally_data.get('yes', '0')))
-        no = int(tally_data.get('no_count', tally_data.get('no', '0')))
-        veto = int(tally_data.get('no_with_veto_count', tally_data.get('no_with_veto', '0')))
-        abstain = int(tally_data.get('abstain_count', tally_data.get('abstain', '0')))
-        total = yes + no + veto + abstain
-
-        return {'yes': yes, 'no': no, 'veto': veto, 'abstain': abstain, 'total': total}
+        response = await api_get_coalesced(
+            client, tally_url, max_retries=max_retries, backoff_base=backoff_base
+        )
+        return parse_tally(orjson.loads(response.content).get('tally', {}))
     except Exception as e:
         logger.error(f"Failed to fetch tally from {tally_url}: {e}")
         return {}
@@ -4,12 +4,16 @@
 
 import asyncio
 import logging
-from typing import Optional
+import random
+from typing import Dict, Optional
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# url -> in-flight GET shared by concurrent api_get_coalesced callers
+_inflight_gets: Dict[str, asyncio.Future] = {}
+
 
 async def api_get_with_retry(
     client: httpx.AsyncClient,
@@ -17,11 +21,14 @@ async def api_get_with_retry(
     max_retries: int = 3,
     backoff_base: float = 2.0,
     timeout: Optional[float] = None,
+    headers: Optional[dict] = None,
 ) -> httpx.Response:
     """Perform an HTTP GET request with exponential backoff retry.
 
     Retries on network errors, timeouts, 5xx server errors, and 429 rate limits.
-    Does NOT retry on 4xx client errors (except 429).
+    Does NOT retry on 4xx client errors (except 429). A 304 Not Modified
+    reply to a conditional request is returned as-is. Waits carry up to 50%
+    random jitter so callers that failed together don't retry in lockstep.
 
     Args:
         client: The httpx async client to use.
@@ -29,6 +36,7 @@ async def api_get_with_retry(
         max_retries: Maximum number of attempts.
         backoff_base: Base for exponential backoff calculation.
         timeout: Optional per-request timeout override.
+        headers: Optional extra request headers (e.g. If-None-Match).
 
     Returns:
         The successful httpx.Response.
@@ -43,7 +51,11 @@ async def api_get_with_retry(
             kwargs = {}
             if timeout is not None:
                 kwargs['timeout'] = timeout
+            if headers:
+                kwargs['headers'] = headers
             response = await client.get(url, **kwargs)
+            if response.status_code == 304:
+                return response
             response.raise_for_status()
             return response
 
@@ -57,7 +69,7 @@ async def api_get_with_retry(
                     raise
 
             if attempt < max_retries - 1:
-                wait_time = backoff_base ** attempt
+                wait_time = backoff_base ** attempt * random.uniform(1.0, 1.5)
 
                 # Rate limit: respect Retry-After header if available
                 if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
@@ -81,3 +93,26 @@ async def api_get_with_retry(
                 logger.error(f"All {max_retries} attempts failed for {url}: {e}")
 
     raise last_exception
+
+
+async def api_get_coalesced(
+    client: httpx.AsyncClient,
+    url: str,
+    max_retries: int = 3,
+    backoff_base: float = 2.0,
+) -> httpx.Response:
+    """Perform api_get_with_retry, sharing one request among concurrent callers.
+
+    While a GET for a URL is in flight, further calls for the same URL await
+    that request instead of issuing their own (e.g. the monitoring tick and a
+    /myvalidators for the same validator). Nothing is cached once it completes.
+    """
+    task = _inflight_gets.get(url)
+    if task is None:
+        task = asyncio.ensure_future(
+            api_get_with_retry(client, url, max_retries=max_retries, backoff_base=backoff_base)
+        )
+        _inflight_gets[url] = task
+        task.add_done_callback(lambda _: _inflight_gets.pop(url, None))
+    # Shield so a cancelled caller doesn't cancel the request for the others
+    return await asyncio.shield(task)
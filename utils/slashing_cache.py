@@ -0,0 +1,189 @@
+# utils/slashing_cache.py
+# -*- coding: utf-8 -*-
+"""Shared per-chain cache of slashing params and signing infos.
+
+Used by both the monitoring loop and slash commands so that TTL handling and
+in-flight request coalescing live in one place. Signing infos change every
+block and expire quickly; slashing params only change via governance, so
+expired params are revalidated with If-None-Match / If-Modified-Since when
+the endpoint supplied validators, and a 304 keeps the cached body.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, NamedTuple, Optional
+
+import httpx
+import orjson
+
+from utils.retry import api_get_with_retry
+
+logger = logging.getLogger(__name__)
+
+SIGNING_INFOS_TTL_SECONDS = 30
+SLASHING_PARAMS_TTL_SECONDS = 3600
+
+
+class SigningInfo(NamedTuple):
+    """The signing info fields read by validator status checks."""
+    missed_blocks_counter: int
+    jailed_until: Optional[str]
+    tombstoned: bool
+
+
+class SlashingParams(NamedTuple):
+    """The slashing params fields used for uptime estimates, parsed once per fetch."""
+    signed_blocks_window: int
+
+
+# chain_name -> {valcons_address: SigningInfo}
+_signing_infos: Dict[str, dict] = {}
+# chain_name -> SlashingParams
+_slashing_params: Dict[str, SlashingParams] = {}
+_signing_infos_fetched_at: Dict[str, float] = {}
+_slashing_params_fetched_at: Dict[str, float] = {}
+# chain_name -> conditional request headers for revalidating slashing params
+_slashing_params_validators: Dict[str, dict] = {}
+# chain_name -> in-flight refresh, shared by concurrent callers
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+def get_signing_infos(chain_name: str) -> dict:
+    """Return cached SigningInfo entries for a chain keyed by consensus address."""
+    return _signing_infos.get(chain_name, {})
+
+
+def get_slashing_params(chain_name: str) -> Optional[SlashingParams]:
+    """Return cached slashing params for a chain, or None if not fetched yet."""
+    return _slashing_params.get(chain_name)
+
+
+def invalidate(chain_name: str):
+    """Drop all cached slashing data for a chain (e.g. after an API failure)."""
+    _signing_infos.pop(chain_name, None)
+    _slashing_params.pop(chain_name, None)
+    _signing_infos_fetched_at.pop(chain_name, None)
+    _slashing_params_fetched_at.pop(chain_name, None)
+    _slashing_params_validators.pop(chain_name, None)
+
+
+def mark_params_stale(chain_name: str):
+    """Force a chain's slashing params to be refetched on the next refresh.
+
+    Called when a governance proposal that changes slashing params passes, so
+    the new window is picked up without waiting out the TTL.
+    """
+    _slashing_params_fetched_at.pop(chain_name, None)
+    _slashing_params_validators.pop(chain_name, None)
+
+
+def _conditional_headers(response: httpx.Response) -> dict:
+    """Build revalidation headers from a response's ETag / Last-Modified."""
+    headers = {}
+    if etag := response.headers.get('ETag'):
+        headers['If-None-Match'] = etag
+    if last_modified := response.headers.get('Last-Modified'):
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+async def _refresh_params(
+    client: httpx.AsyncClient, chain_config, max_retries: int, backoff_base: float
+):
+    """Fetch (or revalidate) a chain's slashing params if they are stale."""
+    chain_name = chain_config.name
+
+    params_age = time.monotonic() - _slashing_params_fetched_at.get(chain_name, 0.0)
+    cached_params = _slashing_params.get(chain_name)
+    if cached_params and params_age < SLASHING_PARAMS_TTL_SECONDS:
+        return
+
+    params_response = await api_get_with_retry(
+        client, chain_config.slashing_params_url, max_retries=max_retries, backoff_base=backoff_base,
+        headers=_slashing_params_validators.get(chain_name) if cached_params else None,
+    )
+    if params_response.status_code != 304:
+        params = orjson.loads(params_response.content).get('params', {})
+        _slashing_params[chain_name] = SlashingParams(
+            int(params.get('signed_blocks_window', 0)),
+        )
+        _slashing_params_validators[chain_name] = _conditional_headers(params_response)
+    _slashing_params_fetched_at[chain_name] = time.monotonic()
+
+
+async def _refresh_signing_infos(
+    client: httpx.AsyncClient, chain_config, max_retries: int, backoff_base: float
+):
+    """Fetch a chain's signing infos into the cache."""
+    signing_response = await api_get_with_retry(
+        client, chain_config.signing_infos_url, max_retries=max_retries, backoff_base=backoff_base
+    )
+    _signing_infos[chain_config.name] = {
+        item['address']: SigningInfo(
+            int(item.get('missed_blocks_counter', -1)),
+            item.get('jailed_until'),
+            bool(item.get('tombstoned')),
+        )
+        for item in orjson.loads(signing_response.content).get('info', ())
+    }
+    _signing_infos_fetched_at[chain_config.name] = time.monotonic()
+
+
+async def _refresh(
+    client: httpx.AsyncClient, chain_config, max_retries: int, backoff_base: float
+):
+    """Fetch signing infos (and params, if stale) for a chain into the cache.
+
+    The two endpoints are independent, so they are requested concurrently.
+    """
+    await asyncio.gather(
+        _refresh_params(client, chain_config, max_retries, backoff_base),
+        _refresh_signing_infos(client, chain_config, max_retries, backoff_base),
+    )
+
+
+async def refresh_slashing_cache(
+    client: httpx.AsyncClient,
+    chain_config,
+    max_retries: int = 3,
+    backoff_base: float = 2.0,
+):
+    """Refresh a chain's signing infos unconditionally.
+
+    Concurrent calls for the same chain share a single request. Raises the
+    underlying exception if the fetch fails.
+    """
+    chain_name = chain_config.name
+    task = _inflight.get(chain_name)
+    if task is None:
+        task = asyncio.ensure_future(_refresh(client, chain_config, max_retries, backoff_base))
+        _inflight[chain_name] = task
+        task.add_done_callback(lambda _: _inflight.pop(chain_name, None))
+    # Shield so a cancelled caller doesn't cancel the fetch for the others
+    await asyncio.shield(task)
+
+
+async def ensure_slashing_cache(
+    client: httpx.AsyncClient,
+    chain_config,
+    max_retries: int = 3,
+    backoff_base: float = 2.0,
+):
+    """Make sure a chain's slashing cache exists and is fresh enough.
+
+    No-op for chains without missed blocks support. Failures are logged and
+    leave whatever was cached before in place.
+    """
+    if not chain_config.missed_blocks_supported:
+        return
+
+    chain_name = chain_config.name
+    info_age = time.monotonic() - _signing_infos_fetched_at.get(chain_name, 0.0)
+    if _signing_infos.get(chain_name) and info_age < SIGNING_INFOS_TTL_SECONDS:
+        return
+
+    try:
+        await refresh_slashing_cache(client, chain_config, max_retries, backoff_base)
+    except Exception as e:
+        logger.warning(f"On-demand slashing cache fetch failed for {chain_name}: {e}")